@@ -5,16 +5,17 @@ Enterprise-grade image conversion application
 
 import sys
 import os
+from datetime import timedelta
 from pathlib import Path
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import QDir, QStandardPaths
+from PyQt6.QtCore import QDir, QStandardPaths, QTimer
 from PyQt6.QtGui import QIcon
-import sentry_sdk
 from loguru import logger
 
 from src.ui.main_window import MainWindow
 from src.core.config import AppConfig
 from src.core.database import DatabaseManager
+from src.core.image_processor import check_accelerated_build
 from src.utils.exceptions import setup_exception_handler
 
 
@@ -31,6 +32,24 @@ def setup_application_directories():
     return app_data_dir
 
 
+class DailyOrSizeRotation:
+    """Loguru rotation: roll over after one day or once the file exceeds max_bytes"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._rollover_at = None
+
+    def __call__(self, message, file) -> bool:
+        record_time = message.record["time"]
+        if self._rollover_at is None:
+            self._rollover_at = record_time + timedelta(days=1)
+
+        if record_time >= self._rollover_at or file.tell() + len(message) > self.max_bytes:
+            self._rollover_at = record_time + timedelta(days=1)
+            return True
+        return False
+
+
 def setup_logging(app_data_dir: Path):
     """Configure Loguru logging"""
     log_dir = app_data_dir / "logs"
@@ -38,28 +57,36 @@ def setup_logging(app_data_dir: Path):
     # Remove default handler
     logger.remove()
     
+    # All sinks are enqueued: records go through a queue to a writer thread,
+    # so conversions never block on log I/O
+    
     # Add console handler for development
     logger.add(
         sys.stderr,
         level="INFO",
+        enqueue=True,
         format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
     )
     
     # Add file handlers
+    # 64 KiB write buffer: the debug log is the high-volume sink
     logger.add(
         log_dir / "app_{time:YYYY-MM-DD}.log",
-        rotation="1 day",
+        rotation=DailyOrSizeRotation(50 * 1024 * 1024),
         retention="30 days",
         level="DEBUG",
+        enqueue=True,
+        buffering=65536,
         format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}"
     )
     
-    # Add error-only file
+    # Add error-only file (low volume, left unbuffered so errors survive a hard crash)
     logger.add(
         log_dir / "errors_{time:YYYY-MM-DD}.log",
-        rotation="1 day",
+        rotation=DailyOrSizeRotation(50 * 1024 * 1024),
         retention="60 days",
         level="ERROR",
+        enqueue=True,
         format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}\n{exception}"
     )
 
@@ -68,6 +95,9 @@ def setup_sentry():
     """Configure Sentry error tracking"""
     sentry_dsn = os.getenv("SENTRY_DSN")
     if sentry_dsn:
+        # Heavy import (~100 ms), only paid when error tracking is enabled
+        import sentry_sdk
+
         sentry_sdk.init(
             dsn=sentry_dsn,
             traces_sample_rate=0.1,
@@ -78,6 +108,32 @@ def setup_sentry():
         logger.warning("Sentry DSN not configured - error tracking disabled")
 
 
+def _bootstrap_ui(app: QApplication, app_data_dir: Path) -> MainWindow:
+    """Create and show the main window (startup critical path)"""
+    # Initialize configuration and database
+    config = AppConfig(app_data_dir)
+    db_manager = DatabaseManager(app_data_dir / "database" / "app.db")
+
+    # Set application icon
+    icon_path = Path(__file__).parent / "assets" / "icon.png"
+    if icon_path.exists():
+        app.setWindowIcon(QIcon(str(icon_path)))
+
+    # Create and show main window
+    main_window = MainWindow(config, db_manager)
+    main_window.show()
+    return main_window
+
+
+def _bootstrap_services(main_window: MainWindow):
+    """Start non-critical services once the first frame is on screen"""
+    setup_sentry()
+    # Reported here only: pool workers create processors too and would repeat it
+    check_accelerated_build()
+    main_window.load_extensions()
+    logger.info("Background services started")
+
+
 def main():
     """Main application entry point"""
     try:
@@ -88,32 +144,27 @@ def main():
         app.setOrganizationName("Alessandro Castaldi")
         app.setOrganizationDomain("imageconverter.local")
         
+        # Drain the enqueued log sinks before shutdown
+        app.aboutToQuit.connect(logger.complete)
+        
         # Setup directories and logging
         app_data_dir = setup_application_directories()
         setup_logging(app_data_dir)
-        setup_sentry()
         setup_exception_handler()
         
         logger.info("Starting Image Converter Pro v3.0.0")
         
-        # Initialize configuration and database
-        config = AppConfig(app_data_dir)
-        db_manager = DatabaseManager(app_data_dir / "database" / "app.db")
-        
-        # Set application icon
-        icon_path = Path(__file__).parent / "assets" / "icon.png"
-        if icon_path.exists():
-            app.setWindowIcon(QIcon(str(icon_path)))
-        
-        # Create and show main window
-        main_window = MainWindow(config, db_manager)
-        main_window.show()
+        main_window = _bootstrap_ui(app, app_data_dir)
+        QTimer.singleShot(0, lambda: _bootstrap_services(main_window))
         
         logger.info("Application started successfully")
         
         # Run application
         exit_code = app.exec()
+        main_window.config.flush()
+        main_window.db_manager.flush()
         logger.info(f"Application exited with code {exit_code}")
+        logger.complete()
         return exit_code
         
     except Exception as e:
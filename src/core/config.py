@@ -1,9 +1,12 @@
 """Application configuration management using Pydantic"""
 
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Set
 from pydantic import BaseModel, Field, validator
-import json
+from PyQt6.QtCore import QCoreApplication, QThread, QTimer
+import orjson
 from loguru import logger
 
 
@@ -16,6 +19,7 @@ class ConversionSettings(BaseModel):
     default_output_format: str = Field(default="png")
     maintain_aspect_ratio: bool = Field(default=True)
     max_image_size: int = Field(default=4096)  # pixels
+    max_workers: int = Field(default=0, ge=0, le=64)  # parallel conversions, 0 = one per CPU
 
     @validator("default_output_format")
     def validate_output_format(cls, v):
@@ -62,13 +66,37 @@ class AppSettings(BaseModel):
         return v.upper()
 
 
+def changed_setting_keys(before: AppSettings, after: AppSettings) -> Set[str]:
+    """Dotted keys (e.g. "ui.theme", "logging_level") whose values differ"""
+    changed: Set[str] = set()
+    for name, value in after:
+        old = getattr(before, name)
+        if value is old:  # untouched sections are shared between updated settings
+            continue
+        if isinstance(value, BaseModel):
+            changed.update(f"{name}.{key}" for key, inner in value if getattr(old, key) != inner)
+        elif value != old:
+            changed.add(name)
+    return changed
+
+
+@lru_cache(maxsize=4)
+def _load_cached(config_file: Path, mtime_ns: int) -> AppSettings:
+    """Parse and validate a config file; keyed on mtime so edits are picked up"""
+    return AppSettings(**orjson.loads(config_file.read_bytes()))
+
+
 class AppConfig:
     """Application configuration manager"""
 
+    # Coalesce bursts of updates into one config.json write
+    SAVE_DEBOUNCE_MS = 500
+
     def __init__(self, app_data_dir: Path):
         self.app_data_dir = app_data_dir
         self.config_file = app_data_dir / "config.json"
         self._settings: Optional[AppSettings] = None
+        self._save_timer: Optional[QTimer] = None
         self.load()
 
     @property
@@ -82,9 +110,8 @@ class AppConfig:
         """Load configuration from file"""
         try:
             if self.config_file.exists():
-                with open(self.config_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                self._settings = AppSettings(**data)
+                mtime_ns = self.config_file.stat().st_mtime_ns
+                self._settings = _load_cached(self.config_file, mtime_ns)
                 logger.info("Configuration loaded successfully")
             else:
                 self._settings = AppSettings()
@@ -98,28 +125,62 @@ class AppConfig:
         """Save configuration to file"""
         try:
             self.config_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.config_file, "w", encoding="utf-8") as f:
-                json.dump(self.settings.dict(), f, indent=2, ensure_ascii=False)
+            # Write to a sibling file and swap it in, so a crash never leaves a partial config
+            tmp_file = self.config_file.with_suffix(".json.tmp")
+            tmp_file.write_bytes(orjson.dumps(self.settings.dict(), option=orjson.OPT_INDENT_2))
+            os.replace(tmp_file, self.config_file)
+            _load_cached.cache_clear()
             logger.debug("Configuration saved")
         except Exception as e:
             logger.error(f"Error saving configuration: {e}")
 
+    def flush(self) -> None:
+        """Write any pending debounced save immediately"""
+        if self._save_timer is not None and self._save_timer.isActive():
+            self._save_timer.stop()
+            self.save()
+
+    def _schedule_save(self) -> None:
+        """Debounce saves on the GUI thread, save directly everywhere else"""
+        app = QCoreApplication.instance()
+        if app is None or QThread.currentThread() is not app.thread():
+            self.save()
+            return
+
+        if self._save_timer is None:
+            self._save_timer = QTimer()
+            self._save_timer.setSingleShot(True)
+            self._save_timer.timeout.connect(self.save)
+        self._save_timer.start(self.SAVE_DEBOUNCE_MS)
+
     def update_settings(self, **kwargs) -> None:
         """Update settings and save"""
         try:
-            current_data = self.settings.dict()
-
-            # Update nested settings
+            # Group nested keys by section
+            section_updates: Dict[str, Dict[str, Any]] = {}
+            top_level: Dict[str, Any] = {}
             for key, value in kwargs.items():
                 if "." in key:
                     section, setting = key.split(".", 1)
-                    if section in current_data:
-                        current_data[section][setting] = value
+                    section_updates.setdefault(section, {})[setting] = value
                 else:
-                    current_data[key] = value
+                    top_level[key] = value
 
-            self._settings = AppSettings(**current_data)
-            self.save()
+            settings = self.settings
+
+            # Re-validate only the sections that were touched
+            updated_sections: Dict[str, BaseModel] = {}
+            for section, updates in section_updates.items():
+                current = getattr(settings, section, None)
+                if isinstance(current, BaseModel):
+                    updated_sections[section] = type(current)(**{**current.dict(), **updates})
+
+            if top_level:
+                self._settings = AppSettings(**{**dict(settings), **updated_sections, **top_level})
+            else:
+                self._settings = settings.copy(update=updated_sections)
+
+            self._schedule_save()
             logger.debug(f"Settings updated: {kwargs}")
         except Exception as e:
             logger.error(f"Error updating settings: {e}")
@@ -1,11 +1,17 @@
 """Database management using SQLite"""
 
+import atexit
+import queue
 import sqlite3
+import threading
+import time
+import weakref
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 from datetime import datetime
 from contextlib import contextmanager
 from pydantic import BaseModel
+from PyQt6.QtCore import QObject, pyqtSignal
 from loguru import logger
 
 
@@ -26,30 +32,217 @@ class ConversionRecord(BaseModel):
     status: str = "completed"  # completed, failed, cancelled
 
 
-class DatabaseManager:
+try:
+    from pydantic import TypeAdapter
+
+    _validate_history = TypeAdapter(List[ConversionRecord]).validate_python
+except ImportError:  # pydantic 1.x
+    from functools import partial
+    from pydantic import parse_obj_as
+
+    _validate_history = partial(parse_obj_as, List[ConversionRecord])
+
+
+INSERT_CONVERSION_SQL = """
+    INSERT INTO conversion_history
+    (source_path, target_path, source_format, target_format,
+     source_size, target_size, width, height, duration_ms, status)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+# Column order of SELECT_HISTORY_SQL rows
+HISTORY_COLUMNS = (
+    "id",
+    "source_path",
+    "target_path",
+    "source_format",
+    "target_format",
+    "source_size",
+    "target_size",
+    "width",
+    "height",
+    "created_at",
+    "duration_ms",
+    "status",
+)
+
+SELECT_HISTORY_SQL = f"""
+    SELECT {", ".join(HISTORY_COLUMNS)} FROM conversion_history
+    ORDER BY created_at DESC
+    LIMIT ?
+"""
+
+SELECT_HISTORY_SINCE_SQL = f"""
+    SELECT {", ".join(HISTORY_COLUMNS)} FROM conversion_history
+    WHERE id > ?
+    ORDER BY id DESC
+    LIMIT ?
+"""
+
+
+def _record_to_row(record: ConversionRecord) -> tuple:
+    """Convert a record into the parameter tuple for INSERT_CONVERSION_SQL"""
+    return (
+        record.source_path,
+        record.target_path,
+        record.source_format,
+        record.target_format,
+        record.source_size,
+        record.target_size,
+        record.width,
+        record.height,
+        record.duration_ms,
+        record.status,
+    )
+
+
+def _count_records(stats: Dict[str, Any], records: List[ConversionRecord]) -> None:
+    """Add inserted records to get_statistics() totals in place"""
+    by_format = stats["by_format"]
+    for record in records:
+        if record.status != "completed":
+            continue
+        stats["total_conversions"] += 1
+        by_format[record.target_format] = by_format.get(record.target_format, 0) + 1
+        if record.source_size > record.target_size:
+            stats["size_saved_bytes"] += record.source_size - record.target_size
+
+
+# Queued records are committed at most this long after the first of a batch arrives
+QUERY_FLUSH_S = 0.1
+
+# Upper bound on records committed by the background writer in one transaction
+WRITE_BATCH_SIZE = 500
+
+
+class _Connection(sqlite3.Connection):
+    """Connection subclass so open handles can be tracked by weak reference"""
+
+
+# Every open connection, closed on interpreter exit
+_open_connections: "weakref.WeakSet[_Connection]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_connections() -> None:
+    for conn in list(_open_connections):
+        conn.close()
+
+
+class DatabaseManager(QObject):
     """SQLite database manager"""
 
+    # Emitted after conversion records are added (from the writing thread)
+    history_changed = pyqtSignal()
+    # Emitted after a transaction() commit, which may delete or rewrite any row:
+    # listeners reload instead of appending
+    history_reset = pyqtSignal()
+
     def __init__(self, db_path: Path):
+        super().__init__()
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+
+        # get_statistics result: inserted records are added to it, any other write
+        # transaction drops it. Results read while an insert is in flight are not cached
+        self._stats_cache: Optional[Dict[str, Any]] = None
+        self._stats_generation = 0
+        self._stats_inserts = 0
+        self._stats_lock = threading.Lock()
+
+        # Background writer for queue_conversion_record, started on first use
+        self._write_queue: "queue.Queue[ConversionRecord]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+
         self.init_database()
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new autocommit connection for the calling thread"""
+        conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, isolation_level=None, factory=_Connection
+        )
+        # Plain tuple rows (no row_factory): hot paths index by position
+        # Per-connection tuning; safe with WAL (durable at checkpoint)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        _open_connections.add(conn)
+        return conn
+
     @contextmanager
-    def get_connection(self):
-        """Get database connection with automatic cleanup"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
+    def get_connection(self) -> Iterator[sqlite3.Connection]:
+        """Get the calling thread's database connection (reused across calls)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+        yield conn
+
+    @contextmanager
+    def _immediate_transaction(self) -> Iterator[sqlite3.Connection]:
+        """BEGIN IMMEDIATE/COMMIT on the thread's connection"""
+        with self.get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run writes on the thread's connection inside BEGIN IMMEDIATE/COMMIT"""
+        with self._immediate_transaction() as conn:
             yield conn
+        self.invalidate_statistics()
+        self.history_reset.emit()
+
+    @contextmanager
+    def _insert_transaction(self, records: List[ConversionRecord]) -> Iterator[sqlite3.Connection]:
+        """Transaction inserting records, which are counted into cached statistics"""
+        with self._stats_lock:
+            self._stats_inserts += 1
+            self._stats_generation += 1
+
+        committed = False
+        try:
+            with self._immediate_transaction() as conn:
+                yield conn
+            committed = True
         finally:
+            with self._stats_lock:
+                self._stats_inserts -= 1
+                # A cached result was read before this insert began, so it excludes it
+                if committed and self._stats_cache is not None:
+                    _count_records(self._stats_cache, records)
+
+    def invalidate_statistics(self) -> None:
+        """Drop the cached statistics so the next read re-queries"""
+        with self._stats_lock:
+            self._stats_cache = None
+            self._stats_generation += 1
+
+    def close(self) -> None:
+        """Close the calling thread's connection"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            _open_connections.discard(conn)
             conn.close()
+            self._local.conn = None
 
-    def init_database(self):
+    def init_database(self) -> None:
         """Initialize database tables"""
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
 
+                # WAL is persistent: readers no longer block writers and commits skip fsync
+                cursor.execute("PRAGMA journal_mode=WAL")
+
                 # Conversion history table
                 cursor.execute(
                     """
@@ -89,7 +282,6 @@ class DatabaseManager:
                     "CREATE INDEX IF NOT EXISTS idx_conversion_format ON conversion_history(target_format)"
                 )
 
-                conn.commit()
                 logger.info("Database initialized successfully")
 
         except Exception as e:
@@ -98,75 +290,102 @@ class DatabaseManager:
     def add_conversion_record(self, record: ConversionRecord) -> int:
         """Add conversion record to history"""
         try:
-            with self.get_connection() as conn:
+            with self._insert_transaction([record]) as conn:
                 cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    INSERT INTO conversion_history 
-                    (source_path, target_path, source_format, target_format, 
-                     source_size, target_size, width, height, duration_ms, status)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        record.source_path,
-                        record.target_path,
-                        record.source_format,
-                        record.target_format,
-                        record.source_size,
-                        record.target_size,
-                        record.width,
-                        record.height,
-                        record.duration_ms,
-                        record.status,
-                    ),
-                )
-                conn.commit()
-                record_id = cursor.lastrowid
-                logger.debug(f"Added conversion record with ID {record_id}")
-                return record_id
+                cursor.execute(INSERT_CONVERSION_SQL, _record_to_row(record))
+                record_id = cursor.lastrowid or 0
+            logger.opt(lazy=True).debug("Added conversion record with ID {}", lambda: record_id)
+            self.history_changed.emit()
+            return record_id
         except Exception as e:
             logger.error(f"Error adding conversion record: {e}")
             return 0
 
+    def add_conversion_records(self, records: List[ConversionRecord]) -> int:
+        """Add several conversion records in a single transaction"""
+        if not records:
+            return 0
+
+        try:
+            with self._insert_transaction(records) as conn:
+                conn.executemany(
+                    INSERT_CONVERSION_SQL, [_record_to_row(record) for record in records]
+                )
+            logger.debug(f"Added {len(records)} conversion records")
+            self.history_changed.emit()
+            return len(records)
+        except Exception as e:
+            logger.error(f"Error adding conversion records: {e}")
+            return 0
+
+    def queue_conversion_record(self, record: ConversionRecord) -> None:
+        """Queue a record for the background writer, which commits in batches"""
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._write_queued_records, name="db-writer", daemon=True
+                )
+                self._writer.start()
+        self._write_queue.put(record)
+
+    def flush(self) -> None:
+        """Block until every queued record has been committed"""
+        self._write_queue.join()
+
+    def _write_queued_records(self) -> None:
+        """Writer thread: group records arriving within QUERY_FLUSH_S into one insert"""
+        while True:
+            batch = [self._write_queue.get()]
+            deadline = time.monotonic() + QUERY_FLUSH_S
+            while len(batch) < WRITE_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._write_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            self.add_conversion_records(batch)
+            for _ in batch:
+                self._write_queue.task_done()
+
     def get_conversion_history(self, limit: int = 100) -> List[ConversionRecord]:
         """Get conversion history"""
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    SELECT * FROM conversion_history 
-                    ORDER BY created_at DESC 
-                    LIMIT ?
-                """,
-                    (limit,),
-                )
+                cursor.execute(SELECT_HISTORY_SQL, (limit,))
 
-                records = []
-                for row in cursor.fetchall():
-                    record = ConversionRecord(
-                        id=row["id"],
-                        source_path=row["source_path"],
-                        target_path=row["target_path"],
-                        source_format=row["source_format"],
-                        target_format=row["target_format"],
-                        source_size=row["source_size"],
-                        target_size=row["target_size"],
-                        width=row["width"],
-                        height=row["height"],
-                        created_at=datetime.fromisoformat(row["created_at"]),
-                        duration_ms=row["duration_ms"],
-                        status=row["status"],
-                    )
-                    records.append(record)
+                # Validate the whole rowset in one call (ISO timestamps parsed by pydantic)
+                return _validate_history(
+                    [dict(zip(HISTORY_COLUMNS, row)) for row in cursor.fetchall()]
+                )
+        except Exception as e:
+            logger.error(f"Error getting conversion history: {e}")
+            return []
 
-                return records
+    def get_conversion_history_since(self, last_id: int, limit: int = 100) -> List[ConversionRecord]:
+        """Get records added after last_id, newest first"""
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(SELECT_HISTORY_SINCE_SQL, (last_id, limit))
+                return _validate_history(
+                    [dict(zip(HISTORY_COLUMNS, row)) for row in cursor.fetchall()]
+                )
         except Exception as e:
             logger.error(f"Error getting conversion history: {e}")
             return []
 
     def get_statistics(self) -> Dict[str, Any]:
-        """Get conversion statistics"""
+        """Get conversion statistics (queried once, then kept up to date by inserts)"""
+        with self._stats_lock:
+            if self._stats_cache is not None:
+                return dict(self._stats_cache, by_format=dict(self._stats_cache["by_format"]))
+            generation = self._stats_generation
+            cacheable = self._stats_inserts == 0
+
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
@@ -175,7 +394,7 @@ class DatabaseManager:
                 cursor.execute(
                     "SELECT COUNT(*) as total FROM conversion_history WHERE status = 'completed'"
                 )
-                total = cursor.fetchone()["total"]
+                total = cursor.fetchone()[0]
 
                 # By format
                 cursor.execute(
@@ -186,7 +405,7 @@ class DatabaseManager:
                     GROUP BY target_format
                 """
                 )
-                by_format = {row["target_format"]: row["count"] for row in cursor.fetchall()}
+                by_format = dict(cursor.fetchall())
 
                 # Total size saved
                 cursor.execute(
@@ -196,13 +415,18 @@ class DatabaseManager:
                     WHERE status = 'completed' AND source_size > target_size
                 """
                 )
-                size_saved = cursor.fetchone()["saved"] or 0
+                size_saved = cursor.fetchone()[0] or 0
 
-                return {
+                stats = {
                     "total_conversions": total,
                     "by_format": by_format,
                     "size_saved_bytes": size_saved,
                 }
+                with self._stats_lock:
+                    # Don't cache a result computed across a concurrent write
+                    if cacheable and generation == self._stats_generation:
+                        self._stats_cache = dict(stats, by_format=dict(by_format))
+                return stats
         except Exception as e:
             logger.error(f"Error getting statistics: {e}")
             return {"total_conversions": 0, "by_format": {}, "size_saved_bytes": 0}
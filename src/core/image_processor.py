@@ -1,10 +1,13 @@
 """Image processing engine with threading support"""
 
+import os
 import time
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Tuple, Callable, Dict, Any
-from PIL import Image, ImageOps
+from typing import Optional, Tuple, Callable, Dict, Any, FrozenSet, List
+import PIL
+from PIL import Image, ImageOps, features
 from PyQt6.QtCore import QThread, pyqtSignal, QObject
 from loguru import logger
 from pydantic import BaseModel
@@ -12,6 +15,35 @@ from pydantic import BaseModel
 from .database import ConversionRecord
 
 
+# Supported extensions (input) and target formats (output), shared by all processors
+INPUT_FORMATS: FrozenSet[str] = frozenset({".jpg", ".jpeg", ".png", ".webp", ".bmp", ".tiff", ".gif"})
+OUTPUT_FORMATS: FrozenSet[str] = frozenset({"jpg", "png", "webp", "ico"})
+
+
+@lru_cache(maxsize=None)
+def check_accelerated_build() -> bool:
+    """Report whether Pillow has the SIMD / libjpeg-turbo fast paths (call once, from the GUI)"""
+    # Pillow-SIMD releases are tagged as post-releases of the matching Pillow version
+    simd = ".post" in PIL.__version__
+    turbo = bool(features.check_feature("libjpeg_turbo"))
+
+    if not simd:
+        logger.info(
+            f"Pillow {PIL.__version__} is not a Pillow-SIMD build - "
+            "resize and encode run on the slow path"
+        )
+    if not turbo:
+        logger.info("Pillow is not linked against libjpeg-turbo - JPEG codec runs unaccelerated")
+
+    return simd and turbo
+
+
+@lru_cache(maxsize=None)
+def get_image_processor() -> "ImageProcessor":
+    """Shared processor instance (one per process); the processor holds no per-call state"""
+    return ImageProcessor()
+
+
 class ImageInfo(BaseModel):
     """Model for image information"""
 
@@ -40,12 +72,13 @@ class ImageProcessor(QObject):
     conversion_completed = pyqtSignal(str, str)  # source_path, target_path
     conversion_failed = pyqtSignal(str, str)  # source_path, error_message
 
-    def __init__(self):
+    supported_formats: Dict[str, FrozenSet[str]] = {
+        "input": INPUT_FORMATS,
+        "output": OUTPUT_FORMATS,
+    }
+
+    def __init__(self) -> None:
         super().__init__()
-        self.supported_formats = {
-            "input": [".jpg", ".jpeg", ".png", ".webp", ".bmp", ".tiff", ".gif"],
-            "output": ["jpg", "png", "webp", "ico"],
-        }
 
     def get_image_info(self, image_path: Path) -> ImageInfo:
         """Get image information"""
@@ -68,33 +101,38 @@ class ImageProcessor(QObject):
         target_path: Path,
         params: ConversionParams,
         progress_callback: Optional[Callable[[int], None]] = None,
+        source_stat: Optional[os.stat_result] = None,
     ) -> ConversionRecord:
-        """Convert single image"""
+        """Convert single image
+
+        Callers enumerating files with os.scandir should pass DirEntry.stat() as
+        source_stat so the directory walk's stat is reused instead of a new syscall.
+        """
         start_time = time.time()
+        source_size = source_stat.st_size if source_stat is not None else None
 
         try:
-            logger.info(f"Converting {source_path} to {target_path}")
+            # Per-file messages: lazy so nothing is formatted when DEBUG is filtered out
+            logger.opt(lazy=True).debug(
+                "Converting {} to {}", lambda: source_path, lambda: target_path
+            )
 
-            # Get source info
-            source_info = self.get_image_info(source_path)
-            if progress_callback:
-                progress_callback(10)
+            if source_size is None:
+                source_size = source_path.stat().st_size
 
-            # Open and process image
-            with Image.open(source_path) as img:
+            # Open once and read source info from the same handle
+            with Image.open(source_path) as source:
+                img: Image.Image = source
+                source_format = (source.format or "Unknown").lower()
                 if progress_callback:
-                    progress_callback(30)
+                    progress_callback(10)
 
                 # Resize if needed
                 if params.resize_width or params.resize_height:
                     img = self._resize_image(img, params)
-                    if progress_callback:
-                        progress_callback(60)
 
                 # Convert color mode if needed
                 img = self._convert_color_mode(img, params.target_format)
-                if progress_callback:
-                    progress_callback(80)
 
                 # Save image
                 self._save_image(img, target_path, params)
@@ -108,18 +146,18 @@ class ImageProcessor(QObject):
             record = ConversionRecord(
                 source_path=str(source_path),
                 target_path=str(target_path),
-                source_format=source_info.format.lower(),
+                source_format=source_format,
                 target_format=params.target_format,
-                source_size=source_info.size_bytes,
+                source_size=source_size,
                 target_size=target_size,
-                width=img.width if "img" in locals() else source_info.width,
-                height=img.height if "img" in locals() else source_info.height,
+                width=img.width,
+                height=img.height,
                 created_at=datetime.now(),
                 duration_ms=duration_ms,
                 status="completed",
             )
 
-            logger.info(f"Conversion completed in {duration_ms}ms")
+            logger.opt(lazy=True).debug("Conversion completed in {}ms", lambda: duration_ms)
             return record
 
         except Exception as e:
@@ -132,7 +170,7 @@ class ImageProcessor(QObject):
                 target_path=str(target_path),
                 source_format=source_path.suffix.lower().lstrip("."),
                 target_format=params.target_format,
-                source_size=source_path.stat().st_size if source_path.exists() else 0,
+                source_size=source_size or 0,
                 target_size=0,
                 created_at=datetime.now(),
                 duration_ms=duration_ms,
@@ -145,6 +183,15 @@ class ImageProcessor(QObject):
         target_width = params.resize_width or img.width
         target_height = params.resize_height or img.height
 
+        # Nothing to resample
+        if (target_width, target_height) == img.size:
+            return img
+
+        # Let the JPEG decoder downscale by 1/2, 1/4 or 1/8 in the DCT instead of
+        # decoding full resolution; keep 2x headroom so LANCZOS sets final quality
+        if img.format == "JPEG":
+            img.draft(img.mode, (target_width * 2, target_height * 2))
+
         if params.maintain_aspect:
             img = ImageOps.contain(img, (target_width, target_height), Image.Resampling.LANCZOS)
         else:
@@ -156,24 +203,34 @@ class ImageProcessor(QObject):
         """Convert color mode based on target format"""
         if target_format.lower() in ("jpg", "jpeg") and img.mode in ("RGBA", "LA", "P"):
             # Convert to RGB for JPEG
-            if img.mode == "P":
+            if img.mode != "RGBA":
                 img = img.convert("RGBA")
 
-            # Create white background
-            background = Image.new("RGB", img.size, (255, 255, 255))
-            if img.mode in ("RGBA", "LA"):
-                background.paste(img, mask=img.split()[-1])  # Use alpha channel as mask
-            else:
-                background.paste(img)
-            img = background
+            # Flatten onto a white background in one composite pass
+            background = Image.new("RGBA", img.size, (255, 255, 255, 255))
+            img = Image.alpha_composite(background, img).convert("RGB")
 
         return img
 
-    def _save_image(self, img: Image.Image, target_path: Path, params: ConversionParams):
+    def _prepare_ico_frames(
+        self, img: Image.Image, sizes: List[Tuple[int, int]]
+    ) -> List[Image.Image]:
+        """Resample a square image to every ICO size, largest first, each from the previous"""
+        frames = []
+        frame = img
+        for size in sorted(sizes, reverse=True):
+            if frame.size != size:
+                frame = frame.resize(size, Image.Resampling.LANCZOS)
+            frames.append(frame)
+        return frames
+
+    def _save_image(
+        self, img: Image.Image, target_path: Path, params: ConversionParams
+    ) -> None:
         """Save image with appropriate parameters"""
         target_path.parent.mkdir(parents=True, exist_ok=True)
 
-        save_kwargs = {}
+        save_kwargs: Dict[str, Any] = {}
 
         if params.target_format.lower() in ("jpg", "jpeg"):
             save_kwargs["quality"] = params.quality
@@ -193,4 +250,12 @@ class ImageProcessor(QObject):
                 available_sizes = [(16, 16)]  # Fallback
             save_kwargs["sizes"] = available_sizes
 
+            # Pillow would thumbnail the full source once per size; for square sources,
+            # hand it frames chained from each previous (already smaller) frame instead.
+            # Non-square sources keep Pillow's aspect-preserving thumbnails.
+            if img.width == img.height:
+                frames = self._prepare_ico_frames(img, available_sizes)
+                img = frames[0]
+                save_kwargs["append_images"] = frames[1:]
+
         img.save(target_path, format=params.target_format.upper(), **save_kwargs)
@@ -11,6 +11,9 @@ from ..core.config import AppConfig
 from ..core.database import DatabaseManager
 
 
+GIF_TAB_TITLE = "GIF Tools"
+
+
 class ExtensionManager:
     """Manages application extensions"""
     
@@ -19,13 +22,13 @@ class ExtensionManager:
         self.db_manager = db_manager
         self.loaded_extensions = {}
         
-    def load_gif_extension(self, tab_widget: QTabWidget) -> Optional[Any]:
-        """Load GIF extension and add tab to main window"""
+    def load_gif_extension(self, tab_widget: QTabWidget, index: int = -1) -> Optional[Any]:
+        """Load GIF extension and insert its tab at index (appended by default)"""
         try:
             from .gif_tab import GifTab
             
             gif_tab = GifTab(self.db_manager)
-            tab_widget.addTab(gif_tab, "GIF Tools")
+            tab_widget.insertTab(index, gif_tab, GIF_TAB_TITLE)
             
             self.loaded_extensions['gif'] = gif_tab
             logger.info("GIF extension loaded successfully")
@@ -4,16 +4,38 @@ GIF Processing Extension for Image Converter Pro
 Extends existing functionality without modifying core code
 """
 
+import os
+import queue
+import shutil
+import subprocess
+import threading
 import time
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
+from itertools import chain
 from pathlib import Path
-from typing import List, Optional, Callable, Union
-from PIL import Image, ImageSequence
+from typing import (
+    Any,
+    BinaryIO,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Callable,
+    Tuple,
+    Union,
+)
+from PIL import GifImagePlugin, Image, ImageChops, ImageSequence, ImageStat
 from pydantic import BaseModel, Field, validator
 from loguru import logger
 
 from ..core.database import ConversionRecord
-from ..core.image_processor import ImageProcessor, ConversionParams
+from ..core.image_processor import ImageProcessor, ConversionParams, INPUT_FORMATS, OUTPUT_FORMATS
+from ..core.worker import SPAWN_POOL_MIN_FILES, lower_pool_priority
 
 
 class GifCreationParams(BaseModel):
@@ -25,6 +47,12 @@ class GifCreationParams(BaseModel):
     resize_width: Optional[int] = Field(default=None, ge=1, le=4096)
     resize_height: Optional[int] = Field(default=None, ge=1, le=4096)
     maintain_aspect: bool = Field(default=True)
+    max_colors: int = Field(default=256, ge=2, le=256)
+    # Palette training trades speed for accuracy: FASTOCTREE is several times faster
+    # than MEDIANCUT with a barely visible difference once dithered. None picks
+    # FASTOCTREE when optimizing and MEDIANCUT otherwise
+    quantize_method: Optional[int] = Field(default=None, ge=0, le=3)
+    max_workers: Optional[int] = Field(default=None, ge=1)  # None = one per CPU
     
     @validator('frame_duration')
     def validate_frame_duration(cls, v):
@@ -32,6 +60,28 @@ class GifCreationParams(BaseModel):
             logger.warning("Frame duration too low, setting to 100ms minimum")
             return 100
         return v
+    
+    def palette_method(self) -> int:
+        """Quantize method used to train the shared palette"""
+        if self.quantize_method is not None:
+            return self.quantize_method
+        return Image.Quantize.FASTOCTREE if self.optimize else Image.Quantize.MEDIANCUT
+    
+    def palette_colors(self) -> int:
+        """Colors in the shared palette"""
+        # With optimize, unchanged pixels of each frame are written as a transparent
+        # index (long LZW runs, much smaller files), which needs a free palette entry
+        if self.optimize:
+            return min(self.max_colors, 255)
+        return self.max_colors
+    
+    def remap_dither(self) -> Image.Dither:
+        """Dither used when remapping frames onto the shared palette"""
+        # Dither noise shimmers between frames in fast animations; a plain nearest-color
+        # remap looks steadier there and is several times cheaper
+        if self.frame_duration < FAST_ANIMATION_MS:
+            return Image.Dither.NONE
+        return Image.Dither.FLOYDSTEINBERG
 
 
 class GifOptimizationParams(BaseModel):
@@ -41,6 +91,291 @@ class GifOptimizationParams(BaseModel):
     dither: bool = Field(default=True)
     transparency: bool = Field(default=True)
     disposal_method: int = Field(default=2)  # 2 = restore background
+    quantize_method: int = Field(default=Image.Quantize.FASTOCTREE, ge=0, le=3)  # see GifCreationParams
+    # gifsicle only (ignored by the Pillow fallback)
+    optimize_level: int = Field(default=3, ge=1, le=3)
+    lossy: Optional[int] = Field(default=None, ge=1, le=200)  # None = lossless
+
+
+# Upper bound on threads encoding extracted frames
+EXTRACT_MAX_WORKERS = 8
+
+# Longest side of each frame thumbnail used to train the shared GIF palette. Smaller
+# thumbnails drop the fine detail and rare colors the palette needs (64 px nearly
+# doubled the remap error); 256 px stays close to training on full frames
+PALETTE_SAMPLE_SIZE = 256
+
+# Source images decoded ahead of palette sampling
+PALETTE_PREFETCH = 4
+
+# Frame durations below this remap frames without dithering
+FAST_ANIMATION_MS = 200
+
+# A frame the shared palette fits this many times worse than the frame's own palette
+# would (nearest-color error on its palette sample) gets its own palette instead
+REMAP_MAX_ERROR_RATIO = 1.5
+
+
+def _method_for_mode(mode: str, method: int) -> int:
+    """Pillow quantizes RGBA only with FASTOCTREE or LIBIMAGEQUANT"""
+    if mode == 'RGBA' and method not in (Image.Quantize.FASTOCTREE, Image.Quantize.LIBIMAGEQUANT):
+        return Image.Quantize.FASTOCTREE
+    return method
+
+
+def _quantize_frame(
+    frame: Image.Image,
+    palette: Optional[Image.Image] = None,
+    colors: int = 256,
+    dither: Image.Dither = Image.Dither.FLOYDSTEINBERG
+) -> Image.Image:
+    """Convert one frame to palette mode (Pillow releases the GIL while quantizing)"""
+    if frame.mode == 'P':
+        return frame
+    
+    # Remap + dither onto the shared palette instead of training a new one (RGB/L only)
+    if palette is not None and frame.mode in ('RGB', 'L'):
+        exact = _remap_exact(frame, palette)
+        if exact is not None:
+            return exact
+        # Frames unlike the rest are quantized on their own (written with a local
+        # color table): dithering onto a palette that misses their colors looks worse
+        # and the noise costs more LZW bytes than the shared palette saves
+        if _fits_palette(frame, palette, colors):
+            return frame.quantize(palette=palette, dither=dither)
+    
+    return frame.quantize(colors=colors, dither=Image.Dither.FLOYDSTEINBERG)
+
+
+def _quantize_error(source: Image.Image, quantized: Image.Image) -> float:
+    """Mean squared error per channel of a quantized copy of an RGB image"""
+    diff = ImageChops.difference(source, quantized.convert('RGB'))
+    return sum(rms * rms for rms in ImageStat.Stat(diff).rms) / 3
+
+
+def _fits_palette(frame: Image.Image, palette: Image.Image, colors: int) -> bool:
+    """Whether the shared palette represents a frame about as well as its own would"""
+    # Undithered on the palette sample: compares palette coverage, not dither noise
+    sample = _palette_sample(frame)
+    shared = _quantize_error(sample, sample.quantize(palette=palette, dither=Image.Dither.NONE))
+    own = _quantize_error(
+        sample,
+        sample.quantize(colors, method=Image.Quantize.FASTOCTREE, dither=Image.Dither.NONE)
+    )
+    return shared <= own * REMAP_MAX_ERROR_RATIO
+
+
+def _remap_exact(frame: Image.Image, palette: Image.Image) -> Optional[Image.Image]:
+    """Map a few-color RGB frame onto the palette, or None unless every color is in it
+
+    Pillow's palette remap looks colors up at reduced precision and can pick a
+    neighboring entry; screenshot-style frames keep their exact colors this way.
+    """
+    if frame.mode != 'RGB':
+        return None
+    
+    palette_data = palette.getpalette() or []
+    index = {tuple(palette_data[i:i + 3]): i // 3 for i in range(0, len(palette_data), 3)}
+    if frame.getcolors(len(index)) is None:  # stops counting early on photos
+        return None
+    
+    # Lossless at this few colors; then renumber its entries into the shared palette
+    own = frame.quantize(colors=len(index))
+    own_data = own.getpalette() or []
+    try:
+        lut = [index[tuple(own_data[i:i + 3])] for i in range(0, len(own_data), 3)]
+    except KeyError:
+        return None
+    
+    mapped = own.point(lut + [0] * (256 - len(lut)))
+    mapped.putpalette(palette_data)
+    return mapped
+
+
+def _add_exact_colors(img: Image.Image, found: set, limit: int) -> Optional[set]:
+    """Add an image's GIF colors to found, or None once there are more than limit"""
+    # Lossy sources never have few enough colors; the raw count bounds the
+    # normalized one, so photos exit after reading a few pixels
+    if img.format == 'JPEG' or img.getcolors(limit) is None:
+        return None
+    
+    rgb = _normalize_for_gif(img)
+    if rgb.mode != 'RGB':
+        rgb = rgb.convert('RGB')
+    found.update(color for _, color in rgb.getcolors(limit) or [])
+    return found if len(found) <= limit else None
+
+
+def _exact_palette(colors: set) -> Image.Image:
+    """Palette image holding exactly the given RGB colors"""
+    palette = Image.new('P', (1, 1))
+    palette.putpalette([value for color in sorted(colors) for value in color])
+    return palette
+
+
+def _normalize_for_gif(img: Image.Image) -> Image.Image:
+    """Bring a source image into a mode GIF frames are built from, converting once"""
+    if img.mode in ('P', 'RGB'):
+        return img
+    
+    if img.mode == 'RGBA':
+        # Flatten onto white once instead of letting quantize drop alpha per frame
+        background = Image.new('RGBA', img.size, (255, 255, 255, 255))
+        return Image.alpha_composite(background, img).convert('RGB')
+    
+    if img.mode in ('L', '1'):
+        # Grayscale palette directly, no RGB round trip
+        return img.convert('P')
+    
+    return img.convert('RGB')
+
+
+def _palette_sample(frame: Image.Image) -> Image.Image:
+    """Small RGB copy of a frame used to train the shared palette"""
+    sample = frame.convert('RGB')
+    sample.thumbnail((PALETTE_SAMPLE_SIZE, PALETTE_SAMPLE_SIZE))
+    return sample
+
+
+def _build_palette(
+    samples: List[Image.Image], colors: int = 256, method: int = Image.Quantize.FASTOCTREE
+) -> Image.Image:
+    """Train one palette on a strip of frame samples"""
+    strip = Image.new('RGB', (sum(s.width for s in samples), max(s.height for s in samples)))
+    x = 0
+    for sample in samples:
+        strip.paste(sample, (x, 0))
+        x += sample.width
+    
+    return strip.quantize(colors=colors, method=method)
+
+
+def _save_frame(frame: Image.Image, frame_path: Path, frame_format: str) -> None:
+    """Write one extracted frame (runs on the extraction pool)"""
+    # Convert frame if needed
+    if frame_format.lower() in ('jpg', 'jpeg') and frame.mode in ('RGBA', 'P'):
+        # Flatten onto a white background for JPEG in one composite pass (no band split)
+        if frame.mode == 'P':
+            frame = frame.convert('RGBA')
+        background = Image.new('RGBA', frame.size, (255, 255, 255, 255))
+        frame = Image.alpha_composite(background, frame).convert('RGB')
+    
+    # BMP is written uncompressed: no zlib/entropy coding per frame, at the cost of
+    # much larger files (re-encode them in bulk later if needed)
+    if frame_format.lower() == 'bmp' and frame.mode not in ('1', 'L', 'P', 'RGB', 'RGBA'):
+        frame = frame.convert('RGBA')
+    
+    frame.save(frame_path)
+
+
+# Picklable frame: mode, size, pixel bytes, palette rawmode and bytes, info
+FrameInfo = Dict[Union[str, Tuple[int, int]], Any]
+FrameState = Tuple[str, Tuple[int, int], bytes, Optional[str], Optional[bytes], FrameInfo]
+
+
+def _frame_to_state(frame: Image.Image) -> FrameState:
+    """Serialize a frame as raw bytes (Image pickling drops RGBA palettes)"""
+    palette_mode = frame.palette.mode if frame.mode == 'P' and frame.palette else None
+    colors = frame.getpalette(palette_mode) if palette_mode else None
+    palette = bytes(colors) if colors is not None else None
+    return frame.mode, frame.size, frame.tobytes(), palette_mode, palette, dict(frame.info)
+
+
+def _frame_from_state(state: FrameState) -> Image.Image:
+    """Rebuild a frame serialized by _frame_to_state"""
+    mode, size, data, palette_mode, palette, info = state
+    frame = Image.frombytes(mode, size, data)
+    if palette is not None:
+        frame.putpalette(palette, rawmode=palette_mode or 'RGB')
+    frame.info.update(info)
+    return frame
+
+
+# Encoded frame: transparent index for its graphic control block, image descriptor +
+# (local color table) + LZW data
+EncodedFrame = Tuple[Optional[int], bytes]
+
+
+def _own_transparency(frame: Image.Image) -> Optional[int]:
+    """Transparent palette index a source frame carries, if any"""
+    transparency = frame.info.get('transparency')
+    return transparency if isinstance(transparency, int) else None
+
+
+def _encode_gif_frame(
+    state: FrameState,
+    previous_state: Optional[FrameState],
+    global_palette: Optional[bytes],
+    transparency: Optional[int]
+) -> Optional[EncodedFrame]:
+    """LZW-encode one GIF frame (pool entry point)
+
+    A frame on the global palette stores only the region that changed from the
+    previous frame, with unchanged pixels set to the transparent index; returns None
+    for a repeated frame. Frames with their own palette are stored whole with a
+    local color table.
+    """
+    frame = _frame_from_state(state)
+    if state[4] != global_palette:
+        data = GifImagePlugin.getdata(frame, include_color_table=True)
+        return _own_transparency(frame), b''.join(data)
+    
+    own = _own_transparency(frame)
+    if previous_state is None or previous_state[4] != global_palette or own is not None:
+        return own, b''.join(GifImagePlugin.getdata(frame))
+    
+    previous = _frame_from_state(previous_state)
+    if _own_transparency(previous) is not None:
+        return None, b''.join(GifImagePlugin.getdata(frame))
+    
+    # Both frames are on the global palette, so palette indices compare directly
+    delta = ImageChops.subtract_modulo(frame, previous)
+    bbox = delta.getbbox()
+    if bbox is None:
+        return None
+    
+    frame = frame.crop(bbox)
+    if transparency is not None:
+        indices = Image.frombytes('L', frame.size, delta.crop(bbox).tobytes())
+        unchanged = indices.point([255] + [0] * 255)
+        frame.paste(transparency, mask=unchanged)
+    return transparency, b''.join(GifImagePlugin.getdata(frame, bbox[:2]))
+
+
+def _map_ordered(
+    executor: Executor, fn: Callable[..., Any], calls: Iterable[tuple], depth: int
+) -> Iterator[Any]:
+    """Executor.map that keeps at most depth calls in flight, so results don't pile up"""
+    pending: Deque[Future] = deque()
+    for args in calls:
+        pending.append(executor.submit(fn, *args))
+        if len(pending) >= depth:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _write_encoded_frame(
+    fp: BinaryIO, data: bytes, duration: int, transparency: Optional[int], disposal: int = 0
+) -> None:
+    """Write a graphic control extension followed by an encoded frame"""
+    packed = disposal << 2 | (1 if transparency is not None else 0)
+    fp.write(
+        b'!\xf9\x04'  # graphic control extension, 4 bytes
+        + bytes([packed])
+        + (duration // 10).to_bytes(2, 'little')  # centiseconds
+        + bytes([transparency or 0, 0])
+    )
+    fp.write(data)
+
+
+def _load_frame_in_pool(
+    image_path: Path, params: 'GifCreationParams', palette_state: Optional[FrameState]
+) -> FrameState:
+    """Pool entry point - GifProcessor is a QObject and cannot be pickled"""
+    palette = _frame_from_state(palette_state) if palette_state else None
+    frame = get_gif_processor()._load_gif_frame(image_path, params, palette)
+    return _frame_to_state(frame)
 
 
 class GifProcessor(ImageProcessor):
@@ -49,23 +384,36 @@ class GifProcessor(ImageProcessor):
     Inherits from ImageProcessor without modifying base class
     """
     
+    # Extend supported formats
+    supported_formats = {
+        'input': INPUT_FORMATS | {'.gif'},
+        'output': OUTPUT_FORMATS | {'gif'},
+    }
+    
     def __init__(self):
         super().__init__()
-        # Extend supported formats
-        self.supported_formats['input'].extend(['.gif'])
-        self.supported_formats['output'].extend(['gif'])
+        
+        # Last shared palette, keyed by its settings and the (path, mtime, size) of its
+        # sources; one tuple so workers sharing the processor swap it atomically
+        self._palette_cache: Tuple[Optional[tuple], Optional[Image.Image]] = (None, None)
         
         logger.info("GIF processor extension loaded")
     
     def create_gif_from_images(
         self,
-        image_paths: List[Path],
+        image_paths: Iterable[Path],
         output_path: Path,
         params: GifCreationParams,
-        progress_callback: Optional[Callable[[int], None]] = None
+        progress_callback: Optional[Callable[[int], None]] = None,
+        frame_callback: Optional[Callable[[int, int], None]] = None
     ) -> ConversionRecord:
-        """Create animated GIF from multiple images"""
+        """Create animated GIF from multiple images
+
+        frame_callback receives (frames written, total frames), at most once per
+        percent alongside progress_callback.
+        """
         start_time = time.time()
+        image_paths = list(image_paths)  # read twice (palette, frames); paths are small
         
         try:
             logger.info(f"Creating GIF from {len(image_paths)} images: {output_path}")
@@ -73,38 +421,52 @@ class GifProcessor(ImageProcessor):
             if progress_callback:
                 progress_callback(5)
             
-            # Load and process all images
-            frames = []
-            total_source_size = 0
+            stats = [image_path.stat() for image_path in image_paths]
+            total_source_size = sum(st.st_size for st in stats)
             
-            for i, image_path in enumerate(image_paths):
-                # Load image
-                img = Image.open(image_path)
-                total_source_size += image_path.stat().st_size
-                
-                # Resize if needed
-                if params.resize_width or params.resize_height:
-                    img = self._resize_gif_frame(img, params)
-                
-                # Convert to RGB if needed (GIF supports palette mode)
-                if img.mode not in ('RGB', 'RGBA', 'P'):
-                    img = img.convert('RGB')
-                
-                frames.append(img)
-                
-                # Update progress
-                if progress_callback:
-                    progress = 5 + int((i + 1) / len(image_paths) * 70)
-                    progress_callback(progress)
+            # Pass 1: train the shared palette, reused when the same sources are encoded
+            # again (e.g. only timing changed)
+            method = params.palette_method()
+            colors = params.palette_colors()
+            palette_key = (colors, method) + tuple(
+                (str(image_path), st.st_mtime_ns, st.st_size)
+                for image_path, st in zip(image_paths, stats)
+            )
+            cached_key, palette = self._palette_cache
+            if palette_key != cached_key:
+                palette = self._train_palette(image_paths, colors, method)
+                self._palette_cache = (palette_key, palette)
             
-            if progress_callback:
-                progress_callback(80)
+            # Pass 2: each pool worker decodes one image and returns only its palette
+            # frame (1 byte per pixel), which is LZW-encoded on the pool as soon as the
+            # previous frame is also in; only a few frames are held at any time
+            load = partial(
+                _load_frame_in_pool,
+                params=params,
+                palette_state=_frame_to_state(palette) if palette else None
+            )
+            last_reported = 5
+            
+            def frame_written(i: int) -> None:
+                # Only when the percentage changes; each call is a signal
+                nonlocal last_reported
+                progress = 5 + int((i + 1) / len(image_paths) * 90)
+                if progress != last_reported:
+                    if progress_callback:
+                        progress_callback(progress)
+                    if frame_callback:
+                        frame_callback(i + 1, len(image_paths))
+                    last_reported = progress
             
             # Create output directory
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Save as animated GIF
-            self._save_animated_gif(frames, output_path, params)
+            depth = 2 * (params.max_workers or os.cpu_count() or 1)
+            with self._create_frame_executor(params, len(image_paths)) as executor:
+                states = _map_ordered(executor, load, ((p,) for p in image_paths), depth)
+                width, height = self._write_gif(
+                    executor, states, output_path, params, depth, frame_written
+                )
             
             if progress_callback:
                 progress_callback(100)
@@ -113,11 +475,6 @@ class GifProcessor(ImageProcessor):
             duration_ms = int((time.time() - start_time) * 1000)
             target_size = output_path.stat().st_size
             
-            # Use dimensions of first frame
-            first_frame = frames[0] if frames else None
-            width = first_frame.width if first_frame else None
-            height = first_frame.height if first_frame else None
-            
             record = ConversionRecord(
                 source_path=f"Multiple images ({len(image_paths)} files)",
                 target_path=str(output_path),
@@ -125,7 +482,7 @@ class GifProcessor(ImageProcessor):
                 target_format="gif",
                 source_size=total_source_size,
                 target_size=target_size,
-                width=width,
+                width=width,  # first frame
                 height=height,
                 created_at=datetime.now(),
                 duration_ms=duration_ms,
@@ -168,52 +525,67 @@ class GifProcessor(ImageProcessor):
             if progress_callback:
                 progress_callback(10)
             
-            # Open GIF and extract frames
-            with Image.open(source_path) as gif:
-                frames = []
-                durations = []
-                
-                for frame in ImageSequence.Iterator(gif):
-                    # Get frame duration
-                    duration = frame.info.get('duration', 100)
-                    durations.append(duration)
+            # Before writing, in case the target replaces the source
+            source_size = source_path.stat().st_size
+            
+            if self._gifsicle_optimize(source_path, target_path, params):
+                with Image.open(source_path) as gif:
+                    width, height = gif.size
+            elif not params.reduce_colors and not params.transparency:
+                # Nothing to re-quantize: skip the decode/encode round trip
+                target_path.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(source_path, target_path)
+                with Image.open(source_path) as gif:
+                    width, height = gif.size
+            else:
+                # Open GIF and extract frames
+                with Image.open(source_path) as gif:
+                    frames = []
+                    durations = []
                     
-                    # Process frame
-                    frame_copy = frame.copy()
+                    # One seek per frame reads both its duration and its pixels
+                    for i in range(getattr(gif, 'n_frames', 1)):
+                        gif.seek(i)
+                        durations.append(gif.info.get('duration', 100))
+                        
+                        # Color reduction if requested; quantize already returns a new image,
+                        # otherwise copy since the next seek reuses the frame
+                        if params.reduce_colors and gif.mode != 'P':
+                            processed = gif.quantize(
+                                colors=params.max_colors,
+                                method=_method_for_mode(gif.mode, params.quantize_method),
+                                dither=Image.Dither.FLOYDSTEINBERG if params.dither else Image.Dither.NONE
+                            )
+                        else:
+                            processed = gif.copy()
+                        
+                        frames.append(processed)
                     
-                    # Color reduction if requested
-                    if params.reduce_colors and frame_copy.mode != 'P':
-                        frame_copy = frame_copy.quantize(
-                            colors=params.max_colors,
-                            dither=Image.Dither.FLOYDSTEINBERG if params.dither else Image.Dither.NONE
-                        )
+                    if progress_callback:
+                        progress_callback(70)
                     
-                    frames.append(frame_copy)
-                
-                if progress_callback:
-                    progress_callback(70)
-                
-                # Save optimized GIF
-                target_path.parent.mkdir(parents=True, exist_ok=True)
+                    # Save optimized GIF
+                    target_path.parent.mkdir(parents=True, exist_ok=True)
+                    
+                    frames[0].save(
+                        target_path,
+                        format='GIF',
+                        save_all=True,
+                        append_images=frames[1:],
+                        duration=durations,
+                        loop=0,
+                        optimize=True,
+                        transparency=255 if params.transparency else None,
+                        disposal=params.disposal_method
+                    )
                 
-                frames[0].save(
-                    target_path,
-                    format='GIF',
-                    save_all=True,
-                    append_images=frames[1:],
-                    duration=durations,
-                    loop=0,
-                    optimize=True,
-                    transparency=255 if params.transparency else None,
-                    disposal=params.disposal_method
-                )
+                width, height = frames[0].size
             
             if progress_callback:
                 progress_callback(100)
             
             # Create record
             duration_ms = int((time.time() - start_time) * 1000)
-            source_size = source_path.stat().st_size
             target_size = target_path.stat().st_size
             
             record = ConversionRecord(
@@ -223,8 +595,8 @@ class GifProcessor(ImageProcessor):
                 target_format="gif",
                 source_size=source_size,
                 target_size=target_size,
-                width=frames[0].width if frames else None,
-                height=frames[0].height if frames else None,
+                width=width,
+                height=height,
                 created_at=datetime.now(),
                 duration_ms=duration_ms,
                 status="completed"
@@ -239,41 +611,98 @@ class GifProcessor(ImageProcessor):
             logger.error(f"GIF optimization failed: {e}")
             raise
     
+    def _gifsicle_optimize(
+        self, source_path: Path, target_path: Path, params: GifOptimizationParams
+    ) -> bool:
+        """Optimize with gifsicle when installed; False if the Pillow path must run"""
+        gifsicle = shutil.which('gifsicle')
+        if not gifsicle:
+            return False
+        
+        # Frame-diff optimizer and LZW in C, typically several times smaller than Pillow
+        args = [gifsicle, f'-O{params.optimize_level}']
+        if params.reduce_colors:
+            args += ['--colors', str(params.max_colors)]
+            if params.dither:
+                args.append('--dither')
+        if params.lossy:
+            args.append(f'--lossy={params.lossy}')
+        
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        result = subprocess.run(
+            args + ['-o', str(target_path), str(source_path)], capture_output=True
+        )
+        if result.returncode == 0:
+            return True
+        
+        error = result.stderr.decode(errors='replace').strip()
+        logger.warning(f"gifsicle failed, optimizing with Pillow: {error}")
+        return False
+    
     def extract_gif_frames(
         self,
         gif_path: Path,
         output_dir: Path,
         frame_format: str = "png",
-        progress_callback: Optional[Callable[[int], None]] = None
+        progress_callback: Optional[Callable[[int], None]] = None,
+        precount_frames: bool = False
     ) -> List[Path]:
-        """Extract individual frames from GIF"""
+        """Extract individual frames from GIF
+        
+        Progress follows the read position in the file; precount_frames=True reports
+        it per frame instead, at the cost of scanning every frame header up front.
+        """
         try:
             logger.info(f"Extracting frames from GIF: {gif_path}")
             
             output_dir.mkdir(parents=True, exist_ok=True)
             extracted_frames = []
+            file_size = max(gif_path.stat().st_size, 1)
+            
+            workers = min(EXTRACT_MAX_WORKERS, os.cpu_count() or 1)
+            # Bounds frames decoded but not yet written
+            in_flight = threading.Semaphore(2 * workers)
+            pending: Deque[Tuple[Future, int]] = deque()  # (write, progress once written)
+            last_reported = -1
+            
+            def report(progress: int) -> None:
+                nonlocal last_reported
+                if progress_callback and progress != last_reported:
+                    progress_callback(progress)
+                    last_reported = progress
+            
+            def report_finished(block: bool) -> None:
+                # Collect writes in frame order so progress and errors stay sequential
+                while pending and (block or pending[0][0].done()):
+                    future, progress = pending.popleft()
+                    future.result()
+                    report(progress)
             
-            with Image.open(gif_path) as gif:
-                total_frames = getattr(gif, 'n_frames', 1)
+            # Own the file handle so its read position is available between frames
+            with open(gif_path, 'rb') as fh, Image.open(fh) as gif, \
+                    ThreadPoolExecutor(max_workers=workers) as executor:
+                total_frames = getattr(gif, 'n_frames', 1) if precount_frames else None
                 
                 for i, frame in enumerate(ImageSequence.Iterator(gif)):
                     frame_path = output_dir / f"frame_{i:04d}.{frame_format}"
                     
-                    # Convert frame if needed
-                    if frame_format.lower() in ('jpg', 'jpeg') and frame.mode in ('RGBA', 'P'):
-                        # Create white background for JPEG
-                        rgb_frame = Image.new('RGB', frame.size, (255, 255, 255))
-                        if frame.mode == 'P':
-                            frame = frame.convert('RGBA')
-                        rgb_frame.paste(frame, mask=frame.split()[-1] if frame.mode == 'RGBA' else None)
-                        frame = rgb_frame
-                    
-                    frame.save(frame_path)
+                    # Decode here, encode and write on the pool; copy since the
+                    # iterator reuses the frame on the next seek
+                    in_flight.acquire()
+                    future = executor.submit(_save_frame, frame.copy(), frame_path, frame_format)
+                    future.add_done_callback(lambda _: in_flight.release())
                     extracted_frames.append(frame_path)
                     
-                    if progress_callback:
+                    if total_frames:
                         progress = int((i + 1) / total_frames * 100)
-                        progress_callback(progress)
+                    else:
+                        progress = min(int(fh.tell() / file_size * 100), 99)
+                    pending.append((future, progress))
+                    
+                    report_finished(block=False)
+                
+                report_finished(block=True)
+                report(100)
             
             logger.info(f"Extracted {len(extracted_frames)} frames to {output_dir}")
             return extracted_frames
@@ -282,45 +711,171 @@ class GifProcessor(ImageProcessor):
             logger.error(f"Frame extraction failed: {e}")
             raise
     
+    def _create_frame_executor(self, params: GifCreationParams, count: int) -> Executor:
+        """Create the pool used to decode and quantize source images"""
+        workers = min(params.max_workers or os.cpu_count() or 1, max(count, 1))
+        
+        # Process startup is expensive where fork is unavailable (spawn on Windows)
+        if os.name == 'nt' and count < SPAWN_POOL_MIN_FILES:
+            return ThreadPoolExecutor(max_workers=workers)
+        
+        return ProcessPoolExecutor(max_workers=workers, initializer=lower_pool_priority)
+    
+    def _train_palette(
+        self, image_paths: List[Path], colors: int, method: int
+    ) -> Optional[Image.Image]:
+        """Sample every image for the shared palette (JPEGs decode at reduced scale)"""
+        # Read + decode of the next images overlaps downsampling of the current one;
+        # Pillow releases the GIL while reading and decoding
+        loaded: 'queue.Queue[Union[Image.Image, Exception, None]]' = queue.Queue(
+            maxsize=PALETTE_PREFETCH
+        )
+        
+        def produce() -> None:
+            try:
+                for image_path in image_paths:
+                    img = Image.open(image_path)
+                    img.draft('RGB', (PALETTE_SAMPLE_SIZE, PALETTE_SAMPLE_SIZE))
+                    img.load()
+                    loaded.put(img)
+            except Exception as e:
+                loaded.put(e)
+            finally:
+                loaded.put(None)
+        
+        threading.Thread(target=produce, name='gif-palette-reader', daemon=True).start()
+        
+        samples = []
+        # Colors of few-color (screenshot-style) sources, None once there are too many
+        exact: Optional[set] = set()
+        while True:
+            item = loaded.get()
+            if item is None:
+                break
+            if isinstance(item, Exception):
+                raise item
+            with item as img:
+                if exact is not None:
+                    exact = _add_exact_colors(img, exact, colors)
+                samples.append(_palette_sample(img))
+        
+        if not samples:
+            return None
+        # Every source color fits: use them as the palette instead of training one
+        if exact:
+            return _exact_palette(exact)
+        return _build_palette(samples, colors, method)
+    
+    def _load_gif_frame(
+        self,
+        image_path: Path,
+        params: GifCreationParams,
+        palette: Optional[Image.Image]
+    ) -> Image.Image:
+        """Decode, resize and quantize one source image for GIF creation"""
+        with Image.open(image_path) as img:
+            frame: Image.Image = img
+            
+            # Resize if needed
+            if params.resize_width or params.resize_height:
+                frame = self._resize_gif_frame(frame, params)
+            
+            frame = _normalize_for_gif(frame)
+            frame = _quantize_frame(frame, palette, params.palette_colors(), params.remap_dither())
+            
+            # Detach from the file, which is closed on return
+            if frame is img:
+                frame = img.copy()
+            return frame
+    
     def _resize_gif_frame(self, img: Image.Image, params: GifCreationParams) -> Image.Image:
         """Resize frame for GIF creation"""
         target_width = params.resize_width or img.width
         target_height = params.resize_height or img.height
         
+        # Let the JPEG decoder downscale in the DCT (must run before the first pixel
+        # access); keep 2x headroom for the final resample
+        if img.format == 'JPEG':
+            img.draft(img.mode, (target_width * 2, target_height * 2))
+        
+        # Below 2x shrink BILINEAR is indistinguishable once quantized to 256 colors
+        shrink = max(img.width / target_width, img.height / target_height)
+        resample = Image.Resampling.BILINEAR if 1 < shrink < 2 else Image.Resampling.LANCZOS
+        
         if params.maintain_aspect:
-            img.thumbnail((target_width, target_height), Image.Resampling.LANCZOS)
+            img.thumbnail((target_width, target_height), resample)
         else:
-            img = img.resize((target_width, target_height), Image.Resampling.LANCZOS)
+            img = img.resize((target_width, target_height), resample)
         
         return img
     
-    def _save_animated_gif(
+    def _write_gif(
         self,
-        frames: List[Image.Image],
+        executor: Executor,
+        states: Iterator[FrameState],
         output_path: Path,
-        params: GifCreationParams
-    ):
-        """Save frames as animated GIF"""
-        if not frames:
+        params: GifCreationParams,
+        depth: int,
+        frame_written: Optional[Callable[[int], None]] = None
+    ) -> Tuple[int, int]:
+        """Encode frames on the pool as they arrive and write them in order
+
+        Returns the first frame's size, which is the GIF canvas size.
+        """
+        first = next(states, None)
+        if first is None:
             raise ValueError("No frames to save")
         
-        # Optimize frames for GIF
-        optimized_frames = []
-        for frame in frames:
-            # Convert to palette mode for smaller file size
-            if frame.mode != 'P':
-                frame = frame.quantize(colors=256, dither=Image.Dither.FLOYDSTEINBERG)
-            optimized_frames.append(frame)
+        first_frame = _frame_from_state(first)
+        global_palette = first[4]  # the first frame's palette is the global color table
+        
+        # The palette's first unused entry marks unchanged pixels (see palette_colors)
+        palette_mode = first[3] or 'RGB'
+        colors = len(global_palette) // len(palette_mode) if global_palette else 256
+        transparency = colors if params.optimize and colors < 256 else None
+        if transparency is not None and global_palette and colors & (colors - 1) == 0:
+            # The color table is padded to a power of two, which a power-of-two palette
+            # fills exactly: one unused extra entry doubles it so the index is inside
+            first_frame.putpalette(
+                global_palette + bytes(len(palette_mode)), rawmode=palette_mode
+            )
+        
+        def calls() -> Iterator[tuple]:
+            # Each frame is delta-encoded against the previous one, which workers get
+            # alongside it, so frames encode independently
+            previous = None
+            for state in chain([first], states):
+                yield state, previous, global_palette, transparency
+                previous = state
         
-        # Save animated GIF
-        optimized_frames[0].save(
-            output_path,
-            format='GIF',
-            save_all=True,
-            append_images=optimized_frames[1:],
-            duration=params.frame_duration,
-            loop=params.loop_count,
-            optimize=params.optimize
+        header, _ = GifImagePlugin.getheader(
+            first_frame, None, {'loop': params.loop_count, 'duration': params.frame_duration}
         )
+        with open(output_path, 'wb') as fp:
+            fp.write(b''.join(header))
+            
+            # A frame is written once the next one is in: repeated frames are dropped
+            # and their time added to the frame before
+            held: Optional[EncodedFrame] = None
+            duration = 0
+            encoded = _map_ordered(executor, _encode_gif_frame, calls(), depth)
+            for i, result in enumerate(encoded):
+                if result is None:
+                    duration += params.frame_duration
+                else:
+                    if held is not None:
+                        _write_encoded_frame(fp, held[1], duration, held[0])
+                    held, duration = result, params.frame_duration
+                if frame_written:
+                    frame_written(i)
+            
+            assert held is not None  # the first frame is never a repeat
+            _write_encoded_frame(fp, held[1], duration, held[0])
+            fp.write(b';')  # trailer
+        
+        return first_frame.size
 
-
+@lru_cache(maxsize=None)
+def get_gif_processor() -> GifProcessor:
+    """Shared processor instance (one per process), used by pool workers"""
+    return GifProcessor()
@@ -13,10 +13,10 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import pyqtSignal, Qt
 from PyQt6.QtGui import QPixmap, QIcon
 from pathlib import Path
-from typing import List
+from typing import List, Set
 from loguru import logger
 
-from .gif_processor import GifCreationParams, GifOptimizationParams
+from .gif_processor import GifCreationParams, GifOptimizationParams, get_gif_processor
 from .gif_worker import GifCreationWorker, GifOptimizationWorker
 from ..core.database import DatabaseManager
 
@@ -32,6 +32,8 @@ class GifTab(QWidget):
         self.creation_worker = None
         self.optimization_worker = None
         self.selected_images = []
+        self._selected_set: Set[Path] = set()  # membership index for selected_images
+        self._gif_processor = get_gif_processor()
         
         self._create_ui()
     
@@ -193,6 +195,15 @@ class GifTab(QWidget):
         self.transparency_check.setChecked(True)
         opt_layout.addWidget(self.transparency_check, 1, 1, 1, 2)
         
+        # Lossy compression (applied when gifsicle is installed)
+        opt_layout.addWidget(QLabel("Lossy:"), 2, 0)
+        self.lossy_spin = QSpinBox()
+        self.lossy_spin.setRange(0, 200)
+        self.lossy_spin.setValue(0)
+        self.lossy_spin.setSpecialValueText("Off")
+        self.lossy_spin.setToolTip("gifsicle lossy compression level (requires gifsicle)")
+        opt_layout.addWidget(self.lossy_spin, 2, 1)
+        
         layout.addWidget(opt_group)
         
         # Optimize button
@@ -233,7 +244,10 @@ class GifTab(QWidget):
         
         extract_settings_layout.addWidget(QLabel("Frame Format:"), 0, 0)
         self.frame_format_combo = QComboBox()
-        self.frame_format_combo.addItems(["PNG", "JPG", "WEBP"])
+        self.frame_format_combo.addItems(["PNG", "JPG", "WEBP", "BMP"])
+        self.frame_format_combo.setItemData(
+            3, "Uncompressed: fastest to write, largest files", Qt.ItemDataRole.ToolTipRole
+        )
         extract_settings_layout.addWidget(self.frame_format_combo, 0, 1)
         
         layout.addWidget(extract_settings_group)
@@ -257,14 +271,22 @@ class GifTab(QWidget):
         )
         
         if files:
-            for file_path in files:
-                if Path(file_path) not in self.selected_images:
-                    self.selected_images.append(Path(file_path))
+            # Repaint once for the whole batch instead of once per item
+            self.image_list.setUpdatesEnabled(False)
+            try:
+                for file_path in files:
+                    path = Path(file_path)
+                    if path in self._selected_set:
+                        continue
+                    self._selected_set.add(path)
+                    self.selected_images.append(path)
                     
                     # Add to list widget
-                    item = QListWidgetItem(Path(file_path).name)
+                    item = QListWidgetItem(path.name)
                     item.setData(Qt.ItemDataRole.UserRole, file_path)
                     self.image_list.addItem(item)
+            finally:
+                self.image_list.setUpdatesEnabled(True)
             
             self.create_gif_btn.setEnabled(len(self.selected_images) >= 2)
             self.status_message.emit(f"Selected {len(self.selected_images)} images for GIF")
@@ -272,6 +294,7 @@ class GifTab(QWidget):
     def _clear_images(self):
         """Clear selected images"""
         self.selected_images.clear()
+        self._selected_set.clear()
         self.image_list.clear()
         self.create_gif_btn.setEnabled(False)
         self.status_message.emit("Cleared image selection")
@@ -386,7 +409,8 @@ class GifTab(QWidget):
             reduce_colors=self.reduce_colors_check.isChecked(),
             max_colors=self.max_colors_spin.value(),
             dither=self.dither_check.isChecked(),
-            transparency=self.transparency_check.isChecked()
+            transparency=self.transparency_check.isChecked(),
+            lossy=self.lossy_spin.value() or None
         )
         
         # Start optimization worker
@@ -457,9 +481,7 @@ class GifTab(QWidget):
             return
         
         try:
-            from .gif_processor import GifProcessor
-            
-            processor = GifProcessor()
+            processor = self._gif_processor
             frame_format = self.frame_format_combo.currentText().lower()
             
             frames = processor.extract_gif_frames(
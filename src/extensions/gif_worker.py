@@ -8,8 +8,9 @@ from pathlib import Path
 from typing import List
 from loguru import logger
 
-from .gif_processor import GifProcessor, GifCreationParams, GifOptimizationParams
+from .gif_processor import GifCreationParams, GifOptimizationParams, get_gif_processor
 from ..core.database import DatabaseManager
+from ..core.worker import WORKER_PRIORITY
 
 
 class GifCreationWorker(QThread):
@@ -33,9 +34,13 @@ class GifCreationWorker(QThread):
         self.output_path = output_path
         self.params = params
         self.db_manager = db_manager
-        self.processor = GifProcessor()
+        self.processor = get_gif_processor()
         self._cancelled = False
     
+    def start(self, priority: QThread.Priority = WORKER_PRIORITY) -> None:
+        """Start the worker thread (below GUI priority by default)"""
+        super().start(priority)
+    
     def cancel(self):
         """Cancel the GIF creation process"""
         self._cancelled = True
@@ -54,11 +59,12 @@ class GifCreationWorker(QThread):
                 self.image_paths,
                 self.output_path,
                 self.params,
-                progress_callback=self.progress_updated.emit
+                progress_callback=self.progress_updated.emit,
+                frame_callback=self.frame_processed.emit
             )
             
-            # Save to database
-            self.db_manager.add_conversion_record(record)
+            # Save to database (batched with other writes by the background writer)
+            self.db_manager.queue_conversion_record(record)
             
             self.creation_completed.emit(str(self.output_path))
             logger.info("GIF creation completed successfully")
@@ -89,9 +95,13 @@ class GifOptimizationWorker(QThread):
         self.target_path = target_path
         self.params = params
         self.db_manager = db_manager
-        self.processor = GifProcessor()
+        self.processor = get_gif_processor()
         self._cancelled = False
     
+    def start(self, priority: QThread.Priority = WORKER_PRIORITY) -> None:
+        """Start the worker thread (below GUI priority by default)"""
+        super().start(priority)
+    
     def cancel(self):
         self._cancelled = True
     
@@ -100,8 +110,6 @@ class GifOptimizationWorker(QThread):
             return
         
         try:
-            original_size = self.source_path.stat().st_size
-            
             record = self.processor.optimize_gif(
                 self.source_path,
                 self.target_path,
@@ -109,11 +117,10 @@ class GifOptimizationWorker(QThread):
                 progress_callback=self.progress_updated.emit
             )
             
-            self.db_manager.add_conversion_record(record)
+            self.db_manager.queue_conversion_record(record)
             
-            # Calculate size reduction
-            new_size = self.target_path.stat().st_size
-            reduction_percent = int((1 - new_size / original_size) * 100)
+            # Calculate size reduction (from the sizes the processor already read)
+            reduction_percent = int((1 - record.target_size / record.source_size) * 100)
             
             self.optimization_completed.emit(str(self.target_path), reduction_percent)
             
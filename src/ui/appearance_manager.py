@@ -3,6 +3,7 @@
 Combined appearance manager that handles both themes and translations
 """
 
+from typing import Mapping
 from PyQt6.QtCore import QObject, pyqtSignal
 from loguru import logger
 
@@ -52,7 +53,7 @@ class AppearanceManager(QObject):
         """Get available theme names"""
         return self.theme_manager.get_available_themes()
     
-    def get_available_languages(self) -> dict:
+    def get_available_languages(self) -> Mapping[str, str]:
         """Get available languages"""
         return self.translation_manager.get_available_languages()
     
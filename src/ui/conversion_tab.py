@@ -16,9 +16,9 @@ from PyQt6.QtWidgets import (
     QMessageBox,
     QGridLayout,
 )
-from PyQt6.QtCore import pyqtSignal, Qt
+from PyQt6.QtCore import pyqtSignal, Qt, QTimer
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 from loguru import logger
 
 from ..core.config import AppConfig
@@ -27,6 +27,10 @@ from ..core.image_processor import ConversionParams
 from ..core.worker import ConversionWorker
 
 
+# Per-file log lines are appended at most this often (ms) instead of once per file
+LOG_FLUSH_INTERVAL_MS = 50
+
+
 class ConversionTab(QWidget):
     """Image conversion tab"""
 
@@ -36,7 +40,13 @@ class ConversionTab(QWidget):
         super().__init__(parent)
         self.config = config
         self.db_manager = db_manager
-        self.conversion_worker = None
+        self.conversion_worker: Optional[ConversionWorker] = None
+
+        # Log lines waiting for the next flush (one QTextEdit append per interval)
+        self._pending_log: List[str] = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._log_timer.timeout.connect(self._flush_log)
 
         self._create_ui()
         self._load_settings()
@@ -187,7 +197,15 @@ class ConversionTab(QWidget):
 
         params = self._get_conversion_params()
 
-        self.conversion_worker = ConversionWorker(files, output_dir, params, self.db_manager)
+        self.conversion_worker = ConversionWorker(
+            files,
+            output_dir,
+            params,
+            self.db_manager,
+            max_workers=self.config.settings.conversion.max_workers or None,
+        )
+        # The worker emits from its own thread, so these connections are queued (never
+        # blocking) and the worker is not held back by UI repaints
         self.conversion_worker.progress_updated.connect(self._update_progress)
         self.conversion_worker.file_completed.connect(self._file_completed)
         self.conversion_worker.file_failed.connect(self._file_failed)
@@ -204,6 +222,7 @@ class ConversionTab(QWidget):
         self.log_text.append(f"Starting conversion of {len(files)} files...")
 
         self.status_message.emit("Converting images...")
+        self._log_timer.start()
         self.conversion_worker.start()
 
     def _update_progress(self, current: int, total: int):
@@ -213,14 +232,23 @@ class ConversionTab(QWidget):
 
     def _file_completed(self, filename: str):
         """Handle completed file"""
-        self.log_text.append(f"✓ Converted: {Path(filename).name}")
+        self._pending_log.append(f"✓ Converted: {Path(filename).name}")
 
     def _file_failed(self, filename: str, error: str):
         """Handle failed file"""
-        self.log_text.append(f"✗ Failed: {Path(filename).name} - {error}")
+        self._pending_log.append(f"✗ Failed: {Path(filename).name} - {error}")
+
+    def _flush_log(self) -> None:
+        """Append the log lines collected since the last flush in one go"""
+        if self._pending_log:
+            self.log_text.append("\n".join(self._pending_log))
+            self._pending_log = []
 
     def _conversion_finished(self, completed: int):
         """Handle conversion completion"""
+        self._log_timer.stop()
+        self._flush_log()
+
         self.progress_bar.setVisible(False)
         self.single_btn.setEnabled(True)
         self.batch_btn.setEnabled(True)
@@ -1,11 +1,13 @@
 """History tab for viewing conversion history"""
 
+import os
+from typing import Any, List, Optional, Tuple
+
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QPushButton,
     QLabel,
     QGroupBox,
@@ -13,31 +15,165 @@ from PyQt6.QtWidgets import (
     QAbstractItemView,
     QMessageBox,
 )
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QFont
-from datetime import datetime
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QObject, QSortFilterProxyModel
+from PyQt6.QtGui import QBrush, QColor
 from loguru import logger
 
-from ..core.database import DatabaseManager
+from ..core.database import ConversionRecord, DatabaseManager
 from ..utils.formatters import format_file_size, format_duration
 
 
+# Rows kept in the history table
+HISTORY_LIMIT = 500
+
+# Role returning raw (unformatted) values, used by the proxy for sorting
+SORT_ROLE = Qt.ItemDataRole.UserRole
+
+# Shared foreground brushes (ForegroundRole wants a QBrush; a QColor is converted per cell)
+GREEN = QBrush(QColor(Qt.GlobalColor.green))
+RED = QBrush(QColor(Qt.GlobalColor.red))
+
+
+class HistoryModel(QAbstractTableModel):
+    """Conversion history records, formatted only when a cell is displayed"""
+
+    HEADERS = ["Date", "Source", "Target", "Format", "Size", "Saved", "Duration", "Status"]
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self.records: List[ConversionRecord] = []  # newest first
+        # Formatted row text, built the first time a row is painted (repaints reuse it)
+        self._text: List[Optional[Tuple[str, ...]]] = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.records)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+
+        row = index.row()
+        column = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._row_text(row)[column]
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self._foreground(self.records[row], column)
+        if role == Qt.ItemDataRole.ToolTipRole:
+            # Full paths only when hovered
+            if column == 1:
+                return self.records[row].source_path
+            if column == 2:
+                return self.records[row].target_path
+            return None
+        if role == SORT_ROLE:
+            return self._sort_key(row, column)
+        return None
+
+    def _row_text(self, row: int) -> Tuple[str, ...]:
+        """Formatted text of every cell in a row (memoized)"""
+        text = self._text[row]
+        if text is None:
+            record = self.records[row]
+            size_diff = record.source_size - record.target_size
+            text = (
+                record.created_at.strftime("%Y-%m-%d %H:%M"),
+                os.path.basename(record.source_path),  # filename only (either separator on Windows)
+                os.path.basename(record.target_path),
+                f"{record.source_format} \u2192 {record.target_format}",
+                format_file_size(record.target_size),
+                f"{'+' if size_diff > 0 else ''}{format_file_size(abs(size_diff))}",
+                format_duration(record.duration_ms),
+                record.status.title(),
+            )
+            self._text[row] = text
+        return text
+
+    def _foreground(self, record: ConversionRecord, column: int) -> Any:
+        """Saved size and status colors"""
+        if column == 5:
+            size_diff = record.source_size - record.target_size
+            if size_diff > 0:
+                return GREEN
+            if size_diff < 0:
+                return RED
+        elif column == 7:
+            if record.status == "completed":
+                return GREEN
+            if record.status == "failed":
+                return RED
+        return None
+
+    def _sort_key(self, row: int, column: int) -> Any:
+        """Raw value a column sorts by (dates and sizes sort numerically)"""
+        record = self.records[row]
+        if column == 0:  # ids follow insertion time and break same-second ties
+            return record.id or 0
+        if column == 4:
+            return record.target_size
+        if column == 5:
+            return record.source_size - record.target_size
+        if column == 6:
+            return record.duration_ms
+        return self._row_text(row)[column]
+
+    def set_records(self, records: List[ConversionRecord]) -> None:
+        """Replace all records"""
+        self.beginResetModel()
+        self.records = list(records)
+        self._text = [None] * len(self.records)
+        self.endResetModel()
+
+    def prepend_records(
+        self, records: List[ConversionRecord], limit: int = HISTORY_LIMIT
+    ) -> None:
+        """Insert newer records (newest first) at the top, keeping at most limit rows"""
+        if not records:
+            return
+
+        self.beginInsertRows(QModelIndex(), 0, len(records) - 1)
+        self.records[:0] = records
+        self._text[:0] = [None] * len(records)
+        self.endInsertRows()
+
+        if len(self.records) > limit:
+            self.beginRemoveRows(QModelIndex(), limit, len(self.records) - 1)
+            del self.records[limit:]
+            del self._text[limit:]
+            self.endRemoveRows()
+
+
 class HistoryTab(QWidget):
     """Conversion history tab"""
 
-    def __init__(self, db_manager: DatabaseManager, parent=None):
+    def __init__(self, db_manager: DatabaseManager, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
         self.db_manager = db_manager
+        self._last_seen_id = 0  # highest record id shown in the table
 
         self._create_ui()
         self._load_history()
 
-        # Auto-refresh timer
-        self.refresh_timer = QTimer()
-        self.refresh_timer.timeout.connect(self._load_history)
-        self.refresh_timer.start(30000)  # Refresh every 30 seconds
+        # Refresh only when records are added, and reload after rows are deleted (e.g.
+        # history cleared from any tab). Emits from worker threads are queued to this
+        # thread by the automatic connection type
+        self.db_manager.history_changed.connect(self._append_new_rows)
+        self.db_manager.history_reset.connect(self._load_history)
 
-    def _create_ui(self):
+    def _create_ui(self) -> None:
         """Create the history UI"""
         layout = QVBoxLayout(self)
 
@@ -62,89 +198,69 @@ class HistoryTab(QWidget):
 
         layout.addWidget(stats_group)
 
-        # History table
-        self.history_table = QTableWidget()
-        self.history_table.setColumnCount(8)
-        self.history_table.setHorizontalHeaderLabels(
-            ["Date", "Source", "Target", "Format", "Size", "Saved", "Duration", "Status"]
-        )
+        # History table: records live in the model, sorting happens on raw values
+        self.history_model = HistoryModel(self)
+        self.history_proxy = QSortFilterProxyModel(self)
+        self.history_proxy.setSourceModel(self.history_model)
+        self.history_proxy.setSortRole(SORT_ROLE)
+
+        self.history_table = QTableView()
+        self.history_table.setModel(self.history_proxy)
 
         # Configure table
         header = self.history_table.horizontalHeader()
+        row_header = self.history_table.verticalHeader()
+        assert header is not None and row_header is not None  # a QTableView owns both
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)  # Source path
         header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)  # Target path
+        row_header.setVisible(False)
 
         self.history_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.history_table.setAlternatingRowColors(True)
         self.history_table.setSortingEnabled(True)
 
+        # Sort by date (newest first)
+        self.history_table.sortByColumn(0, Qt.SortOrder.DescendingOrder)
+
         layout.addWidget(self.history_table)
 
-    def _load_history(self):
+    def _load_history(self) -> None:
         """Load conversion history from database"""
         try:
-            records = self.db_manager.get_conversion_history(500)  # Last 500 records
-            stats = self.db_manager.get_statistics()
-
-            # Update statistics
-            self.total_label.setText(f"Total: {stats['total_conversions']}")
-            size_saved_mb = stats["size_saved_bytes"] / (1024 * 1024)
-            self.size_saved_label.setText(f"Size Saved: {size_saved_mb:.1f} MB")
-
-            # Update table
-            self.history_table.setRowCount(len(records))
-
-            for row, record in enumerate(records):
-                # Date
-                date_item = QTableWidgetItem(record.created_at.strftime("%Y-%m-%d %H:%M"))
-                self.history_table.setItem(row, 0, date_item)
-
-                # Source path (filename only)
-                source_item = QTableWidgetItem(record.source_path.split("/")[-1])
-                self.history_table.setItem(row, 1, source_item)
-
-                # Target path (filename only)
-                target_item = QTableWidgetItem(record.target_path.split("/")[-1])
-                self.history_table.setItem(row, 2, target_item)
-
-                # Format conversion
-                format_item = QTableWidgetItem(f"{record.source_format} → {record.target_format}")
-                self.history_table.setItem(row, 3, format_item)
-
-                # File sizes
-                size_item = QTableWidgetItem(format_file_size(record.target_size))
-                self.history_table.setItem(row, 4, size_item)
-
-                # Size saved/increased
-                size_diff = record.source_size - record.target_size
-                saved_item = QTableWidgetItem(
-                    f"{'+' if size_diff > 0 else ''}{format_file_size(abs(size_diff))}"
-                )
-                if size_diff > 0:
-                    saved_item.setForeground(Qt.GlobalColor.green)
-                elif size_diff < 0:
-                    saved_item.setForeground(Qt.GlobalColor.red)
-                self.history_table.setItem(row, 5, saved_item)
-
-                # Duration
-                duration_item = QTableWidgetItem(format_duration(record.duration_ms))
-                self.history_table.setItem(row, 6, duration_item)
-
-                # Status
-                status_item = QTableWidgetItem(record.status.title())
-                if record.status == "completed":
-                    status_item.setForeground(Qt.GlobalColor.green)
-                elif record.status == "failed":
-                    status_item.setForeground(Qt.GlobalColor.red)
-                self.history_table.setItem(row, 7, status_item)
-
-            # Sort by date (newest first)
-            self.history_table.sortItems(0, Qt.SortOrder.DescendingOrder)
+            records = self.db_manager.get_conversion_history(HISTORY_LIMIT)
+            self._update_statistics()
+
+            self.history_model.set_records(records)
+            self._last_seen_id = max((record.id or 0 for record in records), default=0)
 
         except Exception as e:
             logger.error(f"Error loading history: {e}")
 
-    def _clear_history(self):
+    def _append_new_rows(self) -> None:
+        """Add records inserted since the last load"""
+        try:
+            records = self.db_manager.get_conversion_history_since(
+                self._last_seen_id, HISTORY_LIMIT
+            )
+            if not records:
+                return
+
+            self._update_statistics()
+
+            self.history_model.prepend_records(records)
+            self._last_seen_id = max(self._last_seen_id, records[0].id or 0)
+
+        except Exception as e:
+            logger.error(f"Error loading history: {e}")
+
+    def _update_statistics(self) -> None:
+        """Update the statistics labels"""
+        stats = self.db_manager.get_statistics()
+        self.total_label.setText(f"Total: {stats['total_conversions']}")
+        size_saved_mb = stats["size_saved_bytes"] / (1024 * 1024)
+        self.size_saved_label.setText(f"Size Saved: {size_saved_mb:.1f} MB")
+
+    def _clear_history(self) -> None:
         """Clear conversion history"""
         reply = QMessageBox.question(
             self,
@@ -156,13 +272,10 @@ class HistoryTab(QWidget):
 
         if reply == QMessageBox.StandardButton.Yes:
             try:
-                # Clear database
-                with self.db_manager.get_connection() as conn:
+                # Clear database (history_reset reloads the table)
+                with self.db_manager.transaction() as conn:
                     conn.execute("DELETE FROM conversion_history")
-                    conn.commit()
 
-                # Refresh display
-                self._load_history()
                 logger.info("Conversion history cleared")
 
             except Exception as e:
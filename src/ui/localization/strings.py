@@ -4,52 +4,80 @@ Translatable strings for the application
 Use tr() function for all user-facing strings
 """
 
+from typing import Dict, Tuple
 from PyQt6.QtCore import QCoreApplication
 
 def tr(text: str, context: str = "Global") -> str:
     """Translate text using Qt translation system"""
     return QCoreApplication.translate(context, text)
 
+
+class _TranslatedString:
+    """Translatable string, looked up through the translators once per language"""
+    
+    __slots__ = ('text', 'context')
+    
+    # (context, text) -> translation for the installed translators
+    _cache: Dict[Tuple[str, str], str] = {}
+    
+    def __init__(self, text: str, context: str = "Global"):
+        self.text = text
+        self.context = context
+    
+    def __call__(self) -> str:
+        key = (self.context, self.text)
+        try:
+            return self._cache[key]
+        except KeyError:
+            translation = self._cache[key] = tr(self.text, self.context)
+            return translation
+    
+    def __str__(self) -> str:
+        return self()
+
+
+def invalidate_translations() -> None:
+    """Forget cached translations (call whenever the installed translators change)"""
+    _TranslatedString._cache.clear()
+
 # Common strings used throughout the application
 class Strings:
-    """Container for translatable strings"""
+    """Container for translatable strings (call an entry for its current translation)"""
     
     # Main window
-    MAIN_WINDOW_TITLE = lambda: tr("Image Converter Pro", "MainWindow")
+    MAIN_WINDOW_TITLE = _TranslatedString("Image Converter Pro", "MainWindow")
     
     # Tabs
-    TAB_CONVERT = lambda: tr("Convert", "MainWindow")
-    TAB_HISTORY = lambda: tr("History", "MainWindow") 
-    TAB_SETTINGS = lambda: tr("Settings", "MainWindow")
-    TAB_GIF_TOOLS = lambda: tr("GIF Tools", "MainWindow")
+    TAB_CONVERT = _TranslatedString("Convert", "MainWindow")
+    TAB_HISTORY = _TranslatedString("History", "MainWindow")
+    TAB_SETTINGS = _TranslatedString("Settings", "MainWindow")
+    TAB_GIF_TOOLS = _TranslatedString("GIF Tools", "MainWindow")
     
     # Conversion
-    CONVERT_SINGLE_FILE = lambda: tr("Convert Single File", "ConversionTab")
-    BATCH_CONVERT = lambda: tr("Batch Convert", "ConversionTab")
-    TARGET_FORMAT = lambda: tr("Target Format:", "ConversionTab")
-    QUALITY = lambda: tr("Quality:", "ConversionTab")
-    CONVERSION_SETTINGS = lambda: tr("Conversion Settings", "ConversionTab")
-    MAINTAIN_ASPECT_RATIO = lambda: tr("Maintain Aspect Ratio", "ConversionTab")
+    CONVERT_SINGLE_FILE = _TranslatedString("Convert Single File", "ConversionTab")
+    BATCH_CONVERT = _TranslatedString("Batch Convert", "ConversionTab")
+    TARGET_FORMAT = _TranslatedString("Target Format:", "ConversionTab")
+    QUALITY = _TranslatedString("Quality:", "ConversionTab")
+    CONVERSION_SETTINGS = _TranslatedString("Conversion Settings", "ConversionTab")
+    MAINTAIN_ASPECT_RATIO = _TranslatedString("Maintain Aspect Ratio", "ConversionTab")
     
     # Status messages
-    STATUS_READY = lambda: tr("Ready", "StatusBar")
-    STATUS_CONVERTING = lambda: tr("Converting images...", "StatusBar")
-    STATUS_COMPLETED = lambda: tr("Conversion completed", "StatusBar")
+    STATUS_READY = _TranslatedString("Ready", "StatusBar")
+    STATUS_CONVERTING = _TranslatedString("Converting images...", "StatusBar")
+    STATUS_COMPLETED = _TranslatedString("Conversion completed", "StatusBar")
     
     # Buttons
-    BTN_OK = lambda: tr("OK", "Buttons")
-    BTN_CANCEL = lambda: tr("Cancel", "Buttons")
-    BTN_APPLY = lambda: tr("Apply", "Buttons")
-    BTN_BROWSE = lambda: tr("Browse", "Buttons")
+    BTN_OK = _TranslatedString("OK", "Buttons")
+    BTN_CANCEL = _TranslatedString("Cancel", "Buttons")
+    BTN_APPLY = _TranslatedString("Apply", "Buttons")
+    BTN_BROWSE = _TranslatedString("Browse", "Buttons")
     
     # File dialogs
-    SELECT_IMAGE_FILE = lambda: tr("Select Image File", "FileDialog")
-    SELECT_OUTPUT_DIR = lambda: tr("Select Output Directory", "FileDialog")
-    SAVE_AS = lambda: tr("Save As", "FileDialog")
+    SELECT_IMAGE_FILE = _TranslatedString("Select Image File", "FileDialog")
+    SELECT_OUTPUT_DIR = _TranslatedString("Select Output Directory", "FileDialog")
+    SAVE_AS = _TranslatedString("Save As", "FileDialog")
     
     # Messages
-    CONVERSION_SUCCESS = lambda: tr("Conversion completed successfully!", "Messages")
-    CONVERSION_FAILED = lambda: tr("Conversion failed", "Messages")
-    NO_FILES_SELECTED = lambda: tr("No files selected", "Messages")
-
-
+    CONVERSION_SUCCESS = _TranslatedString("Conversion completed successfully!", "Messages")
+    CONVERSION_FAILED = _TranslatedString("Conversion failed", "Messages")
+    NO_FILES_SELECTED = _TranslatedString("No files selected", "Messages")
@@ -6,13 +6,95 @@ Translation management system with Qt Linguist integration
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 from PyQt6.QtCore import QTranslator, QLocale, QCoreApplication, QObject, pyqtSignal
 from PyQt6.QtWidgets import QApplication
 from loguru import logger
 
 from ...core.config import AppConfig
+from .strings import invalidate_translations
+
+
+# Supported language codes and their display names (read-only, shared by all callers)
+_LANGUAGES: Mapping[str, str] = MappingProxyType({
+    'en': 'English',
+    'it': 'Italiano',
+    'es': 'Español',
+    'fr': 'Français',
+    'de': 'Deutsch',
+    'pt': 'Português',
+    'ru': 'Русский',
+    'zh': '中文',
+    'ja': '日本語',
+    'ko': '한국어'
+})
+
+
+# Basic TS file template written by create_translation_files
+_TS_TEMPLATE = """<?xml version="1.0" encoding="utf-8"?>
+<!DOCTYPE TS>
+<TS version="2.1" language="{lang}">
+<context>
+    <name>MainWindow</name>
+    <message>
+        <source>Convert</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>History</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>Settings</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>GIF Tools</source>
+        <translation type="unfinished"></translation>
+    </message>
+</context>
+<context>
+    <name>ConversionTab</name>
+    <message>
+        <source>Convert Single File</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>Batch Convert</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>Target Format:</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>Quality:</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <source>Conversion Settings</source>
+        <translation type="unfinished"></translation>
+    </message>
+</context>
+</TS>"""
+
+
+@lru_cache(maxsize=1)
+def _system_language() -> str:
+    """Supported language matching the system locale (the locale is read once)"""
+    try:
+        system_locale = QLocale.system()
+        language_code = system_locale.name()[:2]  # Get just language part (e.g., 'en' from 'en_US')
+        
+        # Return if we support this language, otherwise default to English
+        return language_code if language_code in _LANGUAGES else 'en'
+        
+    except Exception as e:
+        logger.error(f"Error detecting system language: {e}")
+        return 'en'
 
 
 class TranslationManager(QObject):
@@ -30,39 +112,26 @@ class TranslationManager(QObject):
         self.app_translator = QTranslator()
         self.qt_translator = QTranslator()
         
+        # Per-language .qm contents and translators parsed from them, so switching back
+        # to a language reuses them (loadFromData does not copy, the bytes must stay alive)
+        self._qm_cache: Dict[str, Tuple[Optional[bytes], Optional[bytes]]] = {}
+        self._translators: Dict[str, Tuple[Optional[QTranslator], Optional[QTranslator]]] = {}
+        
+        # Language whose translators are installed (None until the first apply)
+        self._applied_language: Optional[str] = None
+        
         # Available languages
         self._available_languages = self._scan_available_languages()
         
         logger.info("Translation manager initialized")
     
-    def get_available_languages(self) -> Dict[str, str]:
-        """Get dictionary of available language codes and names"""
-        return {
-            'en': 'English',
-            'it': 'Italiano', 
-            'es': 'Español',
-            'fr': 'Français',
-            'de': 'Deutsch',
-            'pt': 'Português',
-            'ru': 'Русский',
-            'zh': '中文',
-            'ja': '日本語',
-            'ko': '한국어'
-        }
+    def get_available_languages(self) -> Mapping[str, str]:
+        """Get mapping of available language codes and names"""
+        return _LANGUAGES
     
     def get_system_language(self) -> str:
         """Get system default language code"""
-        try:
-            system_locale = QLocale.system()
-            language_code = system_locale.name()[:2]  # Get just language part (e.g., 'en' from 'en_US')
-            
-            # Return if we support this language, otherwise default to English
-            available = self.get_available_languages()
-            return language_code if language_code in available else 'en'
-            
-        except Exception as e:
-            logger.error(f"Error detecting system language: {e}")
-            return 'en'
+        return _system_language()
     
     def apply_language(self, language_code: str = None) -> bool:
         """Apply language to application"""
@@ -78,38 +147,42 @@ class TranslationManager(QObject):
                 logger.error("No QApplication instance found")
                 return False
             
+            # Already installed: reinstalling would only trigger a full retranslation sweep
+            if language_code == self._applied_language:
+                return True
+            
             # Remove current translators
             app.removeTranslator(self.app_translator)
             app.removeTranslator(self.qt_translator)
+            invalidate_translations()
             
             # Don't load translations for English (default)
             if language_code == 'en':
                 logger.info("Using default English language")
+                self._applied_language = language_code
                 self.language_changed.emit(language_code)
                 return True
             
-            # Load application translations
-            app_translation_file = self.translations_dir / f"imageconverter_{language_code}.qm"
-            if app_translation_file.exists():
-                if self.app_translator.load(str(app_translation_file)):
-                    app.installTranslator(self.app_translator)
-                    logger.info(f"Loaded application translation: {language_code}")
-                else:
-                    logger.warning(f"Failed to load app translation: {app_translation_file}")
-            else:
-                logger.warning(f"Translation file not found: {app_translation_file}")
+            app_translator, qt_translator = self._translators_for(language_code)
+            
+            # Install application translations
+            if app_translator is not None:
+                self.app_translator = app_translator
+                app.installTranslator(self.app_translator)
+                logger.info(f"Loaded application translation: {language_code}")
             
-            # Load Qt built-in translations
-            qt_translation_file = self.translations_dir / f"qt_{language_code}.qm"
-            if qt_translation_file.exists():
-                if self.qt_translator.load(str(qt_translation_file)):
-                    app.installTranslator(self.qt_translator)
-                    logger.info(f"Loaded Qt translation: {language_code}")
+            # Install Qt built-in translations
+            if qt_translator is not None:
+                self.qt_translator = qt_translator
+                app.installTranslator(self.qt_translator)
+                logger.info(f"Loaded Qt translation: {language_code}")
             
             # Update configuration
             if language_code != self.config.settings.ui.language:
                 self.config.update_settings(**{'ui.language': language_code})
             
+            self._applied_language = language_code
+            
             # Emit signal
             self.language_changed.emit(language_code)
             
@@ -120,6 +193,49 @@ class TranslationManager(QObject):
             logger.error(f"Error applying language '{language_code}': {e}")
             return False
     
+    def _translators_for(
+        self, language_code: str
+    ) -> Tuple[Optional[QTranslator], Optional[QTranslator]]:
+        """App and Qt translators for a language (files read and parsed on first use)"""
+        translators = self._translators.get(language_code)
+        if translators is not None:
+            return translators
+        
+        app_translation_file = self.translations_dir / f"imageconverter_{language_code}.qm"
+        qt_translation_file = self.translations_dir / f"qt_{language_code}.qm"
+        app_data = self._read_qm(app_translation_file)
+        qt_data = self._read_qm(qt_translation_file)
+        self._qm_cache[language_code] = (app_data, qt_data)
+        
+        app_translator = None
+        if app_data is None:
+            logger.warning(f"Translation file not found: {app_translation_file}")
+        else:
+            app_translator = QTranslator()
+            # The stubs only list sip.array, but any bytes buffer loads. Qt keeps a pointer
+            # to it, and _qm_cache keeps it alive
+            if not app_translator.loadFromData(app_data):  # type: ignore[arg-type]
+                logger.warning(f"Failed to load app translation: {app_translation_file}")
+                app_translator = None
+        
+        qt_translator = None
+        if qt_data is not None:
+            qt_translator = QTranslator()
+            if not qt_translator.loadFromData(qt_data):  # type: ignore[arg-type]
+                qt_translator = None
+        
+        translators = (app_translator, qt_translator)
+        self._translators[language_code] = translators
+        return translators
+    
+    @staticmethod
+    def _read_qm(path: Path) -> Optional[bytes]:
+        """Contents of a .qm file in a single read, or None if it does not exist"""
+        if not path.exists():
+            return None
+        with open(path, 'rb', buffering=0) as f:
+            return f.read()
+    
     def get_current_language(self) -> str:
         """Get current language code"""
         return self.config.settings.ui.language
@@ -132,56 +248,7 @@ class TranslationManager(QObject):
             # Create .ts file for translation
             ts_file = self.translations_dir / f"imageconverter_{language_code}.ts"
             
-            # Basic TS file template
-            ts_content = f"""<?xml version="1.0" encoding="utf-8"?>
-<!DOCTYPE TS>
-<TS version="2.1" language="{language_code}">
-<context>
-    <name>MainWindow</name>
-    <message>
-        <source>Convert</source>
-        <translation type="unfinished"></translation>
-    </message>
-    <message>
-        <source>History</source>
-        <translation type="unfinished"></translation>
-    </message>
-    <message>
-        <source>Settings</source>
-        <translation type="unfinished"></translation>
-    </message>
-    <message>
-        <source>GIF Tools</source>
-        <translation type="unfinished"></translation>
-    </message>
-</context>
-<context>
-    <name>ConversionTab</name>
-    <message>
-        <source>Convert Single File</source>
-        <translation type="unfinished"></translation>
-    </message>
-    <message>
-        <source>Batch Convert</source>
-        <translation type="unfinished"></translation>
-    </message>
-    <message>
-        <source>Target Format:</source>
-        <translation type="unfinished"></translation>
-    </message>
-    <message>
-        <source>Quality:</source>
-        <translation type="unfinished"></translation>
-    </message>
-    <message>
-        <source>Conversion Settings</source>
-        <translation type="unfinished"></translation>
-    </message>
-</context>
-</TS>"""
-            
-            with open(ts_file, 'w', encoding='utf-8') as f:
-                f.write(ts_content)
+            ts_file.write_text(_TS_TEMPLATE.format(lang=language_code), encoding='utf-8')
             
             files_created.append(ts_file)
             logger.info(f"Created translation file: {ts_file}")
@@ -196,10 +263,15 @@ class TranslationManager(QObject):
         available = ['en']  # English is always available (default)
         
         try:
-            for qm_file in self.translations_dir.glob("imageconverter_*.qm"):
-                language_code = qm_file.stem.split('_')[1]
-                if language_code not in available:
-                    available.append(language_code)
+            # scandir: names straight from the directory listing, no stat or Path per entry
+            prefix, suffix = "imageconverter_", ".qm"
+            with os.scandir(self.translations_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith(prefix) and name.endswith(suffix):
+                        language_code = name[len(prefix):-len(suffix)].split('_')[0]
+                        if language_code not in available:
+                            available.append(language_code)
         except Exception as e:
             logger.error(f"Error scanning translation files: {e}")
         
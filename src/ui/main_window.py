@@ -1,26 +1,117 @@
 """Main application window with theme and translation support"""
 
-from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-                             QTabWidget, QMenuBar, QStatusBar, QLabel, QFrame)
-from PyQt6.QtCore import QTimer, QDateTime, Qt
-from PyQt6.QtGui import QAction, QIcon
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Set
+from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QTabWidget,
+                             QStatusBar, QLabel, QFrame, QMessageBox)
+from PyQt6.QtCore import QSize, QTimer, QEvent, Qt
+from PyQt6.QtGui import QAction, QHideEvent, QPainter, QPaintEvent, QShowEvent
 from loguru import logger
 
 from ..core.config import AppConfig
 from ..core.database import DatabaseManager
-from .conversion_tab import ConversionTab
-from .history_tab import HistoryTab
-from .settings_tab import SettingsTab
+
+if TYPE_CHECKING:  # imported when their tabs are first built
+    from ..extensions.extension_manager import ExtensionManager
+    from .conversion_tab import ConversionTab
+    from .history_tab import HistoryTab
+    from .settings_tab import SettingsTab
+
+
+# The status bar clock shows minutes, so it only wakes up on minute boundaries
+CLOCK_INTERVAL_MS = 60_000
+CLOCK_FORMAT = "%d/%m/%Y %H:%M"
+CLOCK_SAMPLE = "00/00/0000 00:00"  # sizes the clock label
+
+# Tab status messages are shown at most once per frame (~60 Hz); the latest one wins
+STATUS_INTERVAL_MS = 16
+
+# Tab and menu titles
+TAB_CONVERT = "Convert"
+TAB_HISTORY = "History"
+TAB_SETTINGS = "Settings"
+MENU_FILE = "&File"
+MENU_VIEW = "&View"
+MENU_TOOLS = "&Tools"
+MENU_HELP = "&Help"
+
+# Settings that require the appearance (theme stylesheet, translators) to be re-applied
+APPEARANCE_KEYS = frozenset({"ui.theme", "ui.language"})
+
+# Inserts a tab's real widget at the given index; None if the tab is not available
+TabBuilder = Callable[[int], Optional[QWidget]]
+
+
+class ClockLabel(QLabel):
+    """Status bar clock drawn in paintEvent: a new time repaints without a relayout"""
+    
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self._time_text = ""
+    
+    def set_time(self, text: str) -> None:
+        """Show a new time (repaint only, the size hint does not depend on the text)"""
+        self._time_text = text
+        self.update()
+    
+    def sizeHint(self) -> QSize:
+        metrics = self.fontMetrics()
+        return QSize(metrics.horizontalAdvance(CLOCK_SAMPLE) + 8, metrics.height())
+    
+    def minimumSizeHint(self) -> QSize:
+        return self.sizeHint()
+    
+    def paintEvent(self, event: Optional[QPaintEvent]) -> None:
+        painter = QPainter(self)
+        painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, self._time_text)
 
 
 class MainWindow(QMainWindow):
     """Main application window with appearance management"""
     
+    # Static menu entries: (menu title, ((action text, shortcut, slot name), ...))
+    _MENU_SPEC = (
+        (MENU_FILE, (("&Exit", "Ctrl+Q", "close"),)),
+        (MENU_VIEW, ()),  # theme and language submenus are added from the appearance manager
+        (MENU_TOOLS, (("&Settings", "Ctrl+,", "_switch_to_settings_tab"),)),
+        (MENU_HELP, (("&About", None, "_show_about"),)),
+    )
+    
+    _ABOUT_TEMPLATE = """
+            <h2>Image Converter Pro v3.0</h2>
+            <p>Professional image conversion application built with PyQt6</p>
+            <p><b>Features:</b></p>
+            <ul>
+                <li>Batch image conversion</li>
+                <li>Multiple format support</li>
+                <li>Image resizing and optimization</li>
+                <li>Conversion history tracking</li>
+                <li>Enterprise-grade logging</li>
+                {appearance_info}
+                {extensions_info}
+            </ul>
+            <p><b>© 2025 Alessandro Castaldi</b></p>
+            """
+    
     def __init__(self, config: AppConfig, db_manager: DatabaseManager):
         super().__init__()
         self.config = config
         self.db_manager = db_manager
         
+        # Populated by load_extensions() once the window is shown
+        self.extension_manager: Optional["ExtensionManager"] = None
+        # Placeholder tab -> builder that inserts the real tab at a given index; every
+        # tab is built the first time it is selected
+        self._lazy_tabs: Dict[QLabel, TabBuilder] = {}
+        # Tab positions are fixed once added; the menu actions switch by index
+        self._gif_tab_index: Optional[int] = None
+        # Rendered About dialog text, rebuilt after extension or appearance changes
+        self._about_html = None
+        # About dialog extensions line, rebuilt when an extension loads
+        self._extensions_html = ""
+        # Tabs that missed an appearance change while hidden, refreshed when next shown
+        self._stale_tabs: Set[QWidget] = set()
+        
         # Initialize appearance manager first (before UI creation)
         self._initialize_appearance_manager()
         
@@ -77,19 +168,23 @@ class MainWindow(QMainWindow):
             self.move(ui_settings.window_x, ui_settings.window_y)
     
     def _create_menus(self):
-        """Create application menus"""
+        """Create application menus (kept on self so they are never looked up by title)"""
         menubar = self.menuBar()
         
-        # File menu
-        file_menu = menubar.addMenu("&File")
-        
-        exit_action = QAction("&Exit", self)
-        exit_action.setShortcut("Ctrl+Q")
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-        
-        # View menu (for appearance options)
-        view_menu = menubar.addMenu("&View")
+        menus = {}
+        for title, actions in self._MENU_SPEC:
+            menu = menus[title] = menubar.addMenu(title)
+            for text, shortcut, slot in actions:
+                action = QAction(text, self)
+                if shortcut:
+                    action.setShortcut(shortcut)
+                action.triggered.connect(getattr(self, slot))
+                menu.addAction(action)
+        
+        self._file_menu = menus[MENU_FILE]
+        self._view_menu = view_menu = menus[MENU_VIEW]
+        self._tools_menu = menus[MENU_TOOLS]
+        self._help_menu = menus[MENU_HELP]
         
         # Theme submenu
         if self.appearance_manager:
@@ -98,7 +193,8 @@ class MainWindow(QMainWindow):
             themes = self.appearance_manager.get_available_themes()
             for theme_name in themes:
                 theme_action = QAction(theme_name.title(), self)
-                theme_action.triggered.connect(lambda checked, t=theme_name: self._change_theme(t))
+                theme_action.setData(theme_name)
+                theme_action.triggered.connect(self._on_theme_action_triggered)
                 theme_menu.addAction(theme_action)
             
             # Language submenu
@@ -107,24 +203,10 @@ class MainWindow(QMainWindow):
             languages = self.appearance_manager.get_available_languages()
             for lang_code, lang_name in languages.items():
                 lang_action = QAction(lang_name, self)
-                lang_action.triggered.connect(lambda checked, code=lang_code: self._change_language(code))
+                lang_action.setData(lang_code)
+                lang_action.triggered.connect(self._on_language_action_triggered)
                 language_menu.addAction(lang_action)
         
-        # Tools menu
-        tools_menu = menubar.addMenu("&Tools")
-        
-        settings_action = QAction("&Settings", self)
-        settings_action.setShortcut("Ctrl+,")
-        settings_action.triggered.connect(lambda: self._switch_to_settings_tab())
-        tools_menu.addAction(settings_action)
-        
-        # Help menu
-        help_menu = menubar.addMenu("&Help")
-        
-        about_action = QAction("&About", self)
-        about_action.triggered.connect(self._show_about)
-        help_menu.addAction(about_action)
-    
     def _create_status_bar(self):
         """Create status bar with clock"""
         self.status_bar = QStatusBar()
@@ -134,6 +216,13 @@ class MainWindow(QMainWindow):
         self.status_label = QLabel("Ready")
         self.status_bar.addWidget(self.status_label)
         
+        # Coalesces bursts of tab status messages into one label update
+        self._pending_status = ""
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(STATUS_INTERVAL_MS)
+        self._status_timer.timeout.connect(self._show_pending_status)
+        
         # Separator
         separator = QFrame()
         separator.setFrameShape(QFrame.Shape.VLine)
@@ -151,19 +240,64 @@ class MainWindow(QMainWindow):
             self.status_bar.addPermanentWidget(separator2)
         
         # Clock label
-        self.clock_label = QLabel()
+        self.clock_label = ClockLabel()
         self.status_bar.addPermanentWidget(self.clock_label)
         
-        # Update clock every second
-        self.clock_timer = QTimer()
+        # Update clock once per minute (stopped while the window is hidden or minimized).
+        # Precise: coarser types round the short re-arm near a boundary down to 0 ms and
+        # spin until the minute changes; one wake-up a minute has nothing to coalesce.
+        self.clock_timer = QTimer(self)
+        self.clock_timer.setSingleShot(True)
+        self.clock_timer.setTimerType(Qt.TimerType.PreciseTimer)
         self.clock_timer.timeout.connect(self._update_clock)
-        self.clock_timer.start(1000)
+        self._clock_text = ""
         self._update_clock()
     
-    def _update_clock(self):
-        """Update status bar clock"""
-        current_time = QDateTime.currentDateTime().toString("dd/MM/yyyy hh:mm:ss")
-        self.clock_label.setText(current_time)
+    def _update_clock(self) -> None:
+        """Update status bar clock and schedule the next update for the next minute"""
+        now = time.time()
+        text = time.strftime(CLOCK_FORMAT, time.localtime(now))
+        if text != self._clock_text:
+            self._clock_text = text
+            self.clock_label.set_time(text)
+        
+        # Re-aligned on every tick so the shown minute never lags behind
+        elapsed_ms = int(now * 1000) % CLOCK_INTERVAL_MS
+        self.clock_timer.start(CLOCK_INTERVAL_MS - elapsed_ms)
+    
+    def _resume_clock(self) -> None:
+        """Resync and restart the clock unless it is already running"""
+        if not self.clock_timer.isActive():
+            self._update_clock()
+    
+    def changeEvent(self, event: Optional[QEvent]) -> None:
+        """Pause the clock while minimized and resync it when restored"""
+        if event is not None and event.type() == QEvent.Type.WindowStateChange:
+            if self.isMinimized():
+                self.clock_timer.stop()
+            else:
+                self._resume_clock()
+        super().changeEvent(event)
+    
+    def hideEvent(self, event: Optional[QHideEvent]) -> None:
+        """Pause the clock while the window is hidden"""
+        self.clock_timer.stop()
+        super().hideEvent(event)
+    
+    def showEvent(self, event: Optional[QShowEvent]) -> None:
+        """Resync the clock when the window is shown again"""
+        self._resume_clock()
+        super().showEvent(event)
+    
+    def _stash_status(self, message: str) -> None:
+        """Queue a tab status message for the next status bar update"""
+        self._pending_status = message
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+    
+    def _show_pending_status(self) -> None:
+        """Show the latest queued status message"""
+        self.status_label.setText(self._pending_status)
     
     def _update_theme_indicator(self):
         """Update theme indicator in status bar"""
@@ -174,8 +308,8 @@ class MainWindow(QMainWindow):
             
             self.theme_indicator.setText(f"{current_theme.title()} | {lang_display}")
     
-    def _create_central_widget(self):
-        """Create central widget with tabs"""
+    def _create_central_widget(self) -> None:
+        """Create central widget with tabs (each tab is built when first selected)"""
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
         
@@ -185,39 +319,106 @@ class MainWindow(QMainWindow):
         self.tab_widget = QTabWidget()
         layout.addWidget(self.tab_widget)
         
-        # Add core tabs
+        # Add core tabs (None until built)
+        self.conversion_tab: Optional["ConversionTab"] = None
+        self.history_tab: Optional["HistoryTab"] = None
+        self.settings_tab: Optional["SettingsTab"] = None
+        
+        self.tab_widget.setUpdatesEnabled(False)
+        try:
+            self._add_lazy_tab(TAB_CONVERT, self._build_conversion_tab)
+            self._add_lazy_tab(TAB_HISTORY, self._build_history_tab)
+            self._settings_tab_index = self._add_lazy_tab(TAB_SETTINGS, self._build_settings_tab)
+        finally:
+            self.tab_widget.setUpdatesEnabled(True)
+        
+        self.tab_widget.currentChanged.connect(self._materialize_tab)
+        self.tab_widget.currentChanged.connect(self._refresh_stale_tab)
+        
+        # The first tab is already current, build it once the window is up
+        QTimer.singleShot(0, lambda: self._materialize_tab(self.tab_widget.currentIndex()))
+    
+    def _add_lazy_tab(self, title: str, build: TabBuilder) -> int:
+        """Add a placeholder tab; build(index) inserts the real tab when it is first selected"""
+        placeholder = QLabel("Loading…")
+        placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._lazy_tabs[placeholder] = build
+        return self.tab_widget.addTab(placeholder, title)
+    
+    def _materialize_tab(self, index: int) -> None:
+        """Replace a placeholder with its real tab the first time it is selected"""
+        placeholder = self.tab_widget.widget(index)
+        if not isinstance(placeholder, QLabel):
+            return  # placeholders are labels, so this tab is built already
+        build = self._lazy_tabs.pop(placeholder, None)
+        if build is None:
+            return
+        
+        title = self.tab_widget.tabText(index)
+        # Insert, select and remove as one change, repainted once afterwards
+        self.tab_widget.setUpdatesEnabled(False)
+        try:
+            try:
+                tab = build(index)
+            except Exception as e:
+                logger.error(f"Error building {title} tab: {e}")
+                tab = None
+            
+            if tab is None:
+                placeholder.setText(f"{title} is not available")
+                return
+            
+            # Select the real tab before dropping the placeholder so the current tab never jumps
+            self.tab_widget.setCurrentWidget(tab)
+            self.tab_widget.removeTab(self.tab_widget.indexOf(placeholder))
+            placeholder.deleteLater()
+        finally:
+            self.tab_widget.setUpdatesEnabled(True)
+    
+    def _build_conversion_tab(self, index: int) -> QWidget:
+        """Build the conversion tab at index"""
+        from .conversion_tab import ConversionTab
+        
         self.conversion_tab = ConversionTab(self.config, self.db_manager, self)
-        self.history_tab = HistoryTab(self.db_manager, self)
-        self.settings_tab = SettingsTab(self.config, self)
+        self.conversion_tab.status_message.connect(self._stash_status)
+        self.tab_widget.insertTab(index, self.conversion_tab, TAB_CONVERT)
+        return self.conversion_tab
+    
+    def _build_history_tab(self, index: int) -> QWidget:
+        """Build the history tab at index (history is first queried here)"""
+        from .history_tab import HistoryTab
         
-        self.tab_widget.addTab(self.conversion_tab, "Convert")
-        self.tab_widget.addTab(self.history_tab, "History")
-        self.tab_widget.addTab(self.settings_tab, "Settings")
+        self.history_tab = HistoryTab(self.db_manager, self)
+        self.tab_widget.insertTab(index, self.history_tab, TAB_HISTORY)
+        return self.history_tab
+    
+    def _build_settings_tab(self, index: int) -> QWidget:
+        """Build the settings tab at index"""
+        from .settings_tab import SettingsTab
         
-        # Connect core tab signals
-        self.conversion_tab.status_message.connect(self.status_label.setText)
+        self.settings_tab = SettingsTab(self.config, self)
         self.settings_tab.settings_changed.connect(self._on_settings_changed)
+        self.tab_widget.insertTab(index, self.settings_tab, TAB_SETTINGS)
+        return self.settings_tab
+
+    # ===============================================
+    # EXTENSION LOADING - GIF SUPPORT
+    # ===============================================
+    
+    def load_extensions(self) -> None:
+        """Register optional extensions (deferred until after the first paint)
         
-        # ===============================================
-        # EXTENSION LOADING - GIF SUPPORT
-        # ===============================================
-        
-        # Load extensions
+        The GIF tab gets a placeholder; its modules are imported and the real tab is
+        built the first time the placeholder is selected.
+        """
         try:
-            from ..extensions.extension_manager import ExtensionManager
+            from ..extensions.extension_manager import GIF_TAB_TITLE, ExtensionManager
             self.extension_manager = ExtensionManager(self.config, self.db_manager)
             
-            # Load GIF extension
-            gif_tab = self.extension_manager.load_gif_extension(self.tab_widget)
-            if gif_tab:
-                # Connect GIF tab signals to main window
-                gif_tab.status_message.connect(self.status_label.setText)
-                logger.info("GIF extension integrated successfully")
-                
-                # Update menu to reflect GIF capability
-                self._update_menus_for_extensions()
-            else:
-                logger.warning("GIF extension failed to load")
+            self._gif_tab_index = self._add_lazy_tab(GIF_TAB_TITLE, self._build_gif_tab)
+            
+            # Update menu to reflect GIF capability
+            self._update_menus_for_extensions()
                 
         except ImportError:
             logger.info("Extensions module not available - running with core features only")
@@ -227,56 +428,61 @@ class MainWindow(QMainWindow):
             logger.info("Continuing with core features only")
             self.extension_manager = None
     
+    def _build_gif_tab(self, index: int) -> Optional[QWidget]:
+        """Build the GIF tab at index through the extension manager"""
+        assert self.extension_manager is not None  # set before the tab is registered
+        gif_tab = self.extension_manager.load_gif_extension(self.tab_widget, index)
+        if gif_tab:
+            # Connect GIF tab signals to main window
+            gif_tab.status_message.connect(self._stash_status)
+            self._extensions_html = self._render_extensions_html()
+            self._about_html = None
+            logger.info("GIF extension integrated successfully")
+        else:
+            logger.warning("GIF extension failed to load")
+        return gif_tab
+    
     def _update_menus_for_extensions(self):
         """Update menus when extensions are loaded"""
         try:
             # Add GIF-specific menu items if extension is loaded
-            if hasattr(self, 'extension_manager') and self.extension_manager and self.extension_manager.get_extension('gif'):
-                # Find Tools menu
-                tools_menu = None
-                for action in self.menuBar().actions():
-                    if action.text() == "&Tools":
-                        tools_menu = action.menu()
-                        break
+            if hasattr(self, 'extension_manager') and self.extension_manager:
+                # Add separator
+                self._tools_menu.addSeparator()
                 
-                if tools_menu:
-                    # Add separator
-                    tools_menu.addSeparator()
-                    
-                    # Add GIF-specific actions
-                    gif_action = QAction("&GIF Tools", self)
-                    gif_action.setShortcut("Ctrl+G")
-                    gif_action.triggered.connect(self._switch_to_gif_tab)
-                    tools_menu.addAction(gif_action)
-                    
-                    logger.debug("Added GIF menu items")
+                # Add GIF-specific actions
+                gif_action = QAction("&GIF Tools", self)
+                gif_action.setShortcut("Ctrl+G")
+                gif_action.triggered.connect(self._switch_to_gif_tab)
+                self._tools_menu.addAction(gif_action)
+                
+                logger.debug("Added GIF menu items")
                     
         except Exception as e:
             logger.error(f"Error updating menus for extensions: {e}")
     
     def _switch_to_gif_tab(self):
         """Switch to GIF tab via menu action"""
-        try:
-            # Find GIF tab by looking for tab with "GIF" in title
-            for i in range(self.tab_widget.count()):
-                if "GIF" in self.tab_widget.tabText(i):
-                    self.tab_widget.setCurrentIndex(i)
-                    self.status_label.setText("Switched to GIF Tools")
-                    break
-        except Exception as e:
-            logger.error(f"Error switching to GIF tab: {e}")
+        if self._gif_tab_index is not None:
+            self.tab_widget.setCurrentIndex(self._gif_tab_index)
+            self.status_label.setText("Switched to GIF Tools")
     
     def _switch_to_settings_tab(self):
         """Switch to settings tab via menu action"""
-        try:
-            # Find settings tab
-            for i in range(self.tab_widget.count()):
-                if "Settings" in self.tab_widget.tabText(i):
-                    self.tab_widget.setCurrentIndex(i)
-                    self.status_label.setText("Switched to Settings")
-                    break
-        except Exception as e:
-            logger.error(f"Error switching to settings tab: {e}")
+        self.tab_widget.setCurrentIndex(self._settings_tab_index)
+        self.status_label.setText("Switched to Settings")
+    
+    def _on_theme_action_triggered(self) -> None:
+        """Theme menu slot (the theme name is stored in the action data)"""
+        action = self.sender()
+        if isinstance(action, QAction):
+            self._change_theme(action.data())
+    
+    def _on_language_action_triggered(self) -> None:
+        """Language menu slot (the language code is stored in the action data)"""
+        action = self.sender()
+        if isinstance(action, QAction):
+            self._change_language(action.data())
     
     def _change_theme(self, theme_name: str):
         """Change theme via menu action"""
@@ -299,16 +505,13 @@ class MainWindow(QMainWindow):
     
     def _show_about(self):
         """Show about dialog"""
-        from PyQt6.QtWidgets import QMessageBox
-        
-        # Check if extensions are loaded for about dialog
-        extensions_info = ""
-        if hasattr(self, 'extension_manager') and self.extension_manager:
-            loaded_extensions = self.extension_manager.list_extensions()
-            if loaded_extensions:
-                extension_names = list(loaded_extensions.keys())
-                extensions_info = f"<li>Extensions: {', '.join(extension_names).upper()}</li>"
+        if self._about_html is None:
+            self._about_html = self._render_about_html()
         
+        QMessageBox.about(self, "About Image Converter Pro", self._about_html)
+    
+    def _render_about_html(self) -> str:
+        """About dialog text (cached until extensions or appearance change)"""
         # Check appearance features
         appearance_info = ""
         if self.appearance_manager:
@@ -316,32 +519,29 @@ class MainWindow(QMainWindow):
             languages = len(self.appearance_manager.get_available_languages())
             appearance_info = f"<li>Themes: {themes} available</li><li>Languages: {languages} supported</li>"
         
-        QMessageBox.about(
-            self,
-            "About Image Converter Pro",
-            f"""
-            <h2>Image Converter Pro v3.0</h2>
-            <p>Professional image conversion application built with PyQt6</p>
-            <p><b>Features:</b></p>
-            <ul>
-                <li>Batch image conversion</li>
-                <li>Multiple format support</li>
-                <li>Image resizing and optimization</li>
-                <li>Conversion history tracking</li>
-                <li>Enterprise-grade logging</li>
-                {appearance_info}
-                {extensions_info}
-            </ul>
-            <p><b>© 2025 Alessandro Castaldi</b></p>
-            """
+        return self._ABOUT_TEMPLATE.format(
+            appearance_info=appearance_info, extensions_info=self._extensions_html
         )
     
-    def _on_settings_changed(self):
-        """Handle settings changes"""
-        logger.info("Settings changed, applying updates")
+    def _render_extensions_html(self) -> str:
+        """About dialog line listing the loaded extensions"""
+        if self.extension_manager is None:
+            return ""
+        loaded_extensions = self.extension_manager.list_extensions()
+        if not loaded_extensions:
+            return ""
+        return f"<li>Extensions: {', '.join(loaded_extensions).upper()}</li>"
+    
+    def _on_settings_changed(self, changed: set) -> None:
+        """Handle settings changes (changed holds the dotted keys that differ)"""
+        # An apply that changed nothing has nothing to refresh or broadcast
+        if not changed:
+            return
         
-        # Refresh appearance if settings changed
-        if self.appearance_manager:
+        logger.info(f"Settings changed, applying updates: {', '.join(sorted(changed))}")
+        
+        # Refresh appearance only if an appearance setting changed
+        if self.appearance_manager and APPEARANCE_KEYS & changed:
             try:
                 # Re-apply current settings in case they changed
                 self.appearance_manager.initialize()
@@ -358,24 +558,27 @@ class MainWindow(QMainWindow):
         except Exception as e:
             logger.error(f"Error notifying extensions of settings change: {e}")
     
-    def _on_appearance_changed(self):
+    def _on_appearance_changed(self) -> None:
         """Handle appearance changes (theme/language switch)"""
         try:
+            self._about_html = None
+            
             # Update status bar theme indicator
             if hasattr(self, 'theme_indicator'):
                 self._update_theme_indicator()
             
-            # Force UI refresh
-            self.update()
+            # No forced repaint: setStyleSheet repaints restyled widgets and translator
+            # changes reach widgets as QEvent.LanguageChange
             
-            # Notify all tabs of appearance change
+            # Refresh the visible tab now and the others when they are next shown
+            current = self.tab_widget.currentWidget()
             for i in range(self.tab_widget.count()):
                 widget = self.tab_widget.widget(i)
-                if hasattr(widget, 'refresh_appearance'):
-                    try:
-                        widget.refresh_appearance()
-                    except Exception as e:
-                        logger.error(f"Error refreshing appearance for tab {i}: {e}")
+                if widget is not None and hasattr(widget, 'refresh_appearance'):
+                    if widget is current:
+                        self._refresh_tab(widget)
+                    else:
+                        self._stale_tabs.add(widget)
             
             # Update window title if language changed
             self.setWindowTitle("Image Converter Pro v3.0")
@@ -385,41 +588,66 @@ class MainWindow(QMainWindow):
         except Exception as e:
             logger.error(f"Error handling appearance change: {e}")
     
+    def _refresh_stale_tab(self, index: int) -> None:
+        """Catch up on an appearance change the newly shown tab missed"""
+        widget = self.tab_widget.widget(index)
+        if widget in self._stale_tabs:
+            self._stale_tabs.discard(widget)
+            self._refresh_tab(widget)
+    
+    def _refresh_tab(self, widget: Any) -> None:
+        """Let a tab refresh itself after an appearance change"""
+        try:
+            widget.refresh_appearance()
+        except Exception as e:
+            logger.error(f"Error refreshing appearance for tab {self.tab_widget.indexOf(widget)}: {e}")
+    
     def closeEvent(self, event):
         """Handle window close event"""
-        # Save window position and size
-        geometry = self.geometry()
-        self.config.update_settings(**{
-            'ui.window_width': geometry.width(),
-            'ui.window_height': geometry.height(),
-            'ui.window_x': geometry.x(),
-            'ui.window_y': geometry.y()
-        })
-        
-        # Cleanup extensions if they exist
+        # Save window position and size if they changed (debounced, flushed once the
+        # event loop exits). pos() is the frame position that move() restores.
+        size, pos = self.size(), self.pos()
+        ui_settings = self.config.settings.ui
+        saved = (ui_settings.window_width, ui_settings.window_height,
+                 ui_settings.window_x, ui_settings.window_y)
+        current = (size.width(), size.height(), pos.x(), pos.y())
+        if current != saved:
+            self.config.update_settings(**{
+                'ui.window_width': current[0],
+                'ui.window_height': current[1],
+                'ui.window_x': current[2],
+                'ui.window_y': current[3]
+            })
+        
+        # Disappear right away instead of freezing on screen while workers wind down
+        self.hide()
+        self._join_extension_workers()
+        
+        logger.info("Application closing")
+        event.accept()
+    
+    def _join_extension_workers(self) -> None:
+        """Cancel running extension workers and wait for them to stop"""
         try:
             if hasattr(self, 'extension_manager') and self.extension_manager:
                 # Cancel any running extension operations
                 gif_extension = self.extension_manager.get_extension('gif')
                 if gif_extension:
-                    # Cancel any running workers
-                    if hasattr(gif_extension, 'creation_worker') and gif_extension.creation_worker:
-                        if gif_extension.creation_worker.isRunning():
-                            gif_extension.creation_worker.cancel()
-                            gif_extension.creation_worker.wait(3000)  # Wait up to 3 seconds
-                    
-                    if hasattr(gif_extension, 'optimization_worker') and gif_extension.optimization_worker:
-                        if gif_extension.optimization_worker.isRunning():
-                            gif_extension.optimization_worker.cancel()
-                            gif_extension.optimization_worker.wait(3000)
+                    # Cancel every worker first so they wind down concurrently
+                    workers = [
+                        getattr(gif_extension, name, None)
+                        for name in ('creation_worker', 'optimization_worker')
+                    ]
+                    running = [worker for worker in workers if worker and worker.isRunning()]
+                    for worker in running:
+                        worker.cancel()
+                    for worker in running:
+                        worker.wait(3000)  # Wait up to 3 seconds
                 
                 logger.info("Extensions cleanup completed")
                 
         except Exception as e:
             logger.error(f"Error during extension cleanup: {e}")
-        
-        logger.info("Application closing")
-        event.accept()
     
     # ===============================================
     # EXTENSION SUPPORT METHODS
@@ -8,13 +8,13 @@ from PyQt6.QtCore import pyqtSignal, Qt
 from datetime import datetime
 from loguru import logger
 
-from ..core.config import AppConfig
+from ..core.config import AppConfig, changed_setting_keys
 
 
 class SettingsTab(QWidget):
     """Application settings tab with full theming and translation support"""
     
-    settings_changed = pyqtSignal()
+    settings_changed = pyqtSignal(object)  # set of changed dotted setting keys
     
     def __init__(self, config: AppConfig, parent=None):
         super().__init__(parent)
@@ -309,8 +309,9 @@ class SettingsTab(QWidget):
         
         performance_layout.addWidget(QLabel("Worker Threads:"), 0, 0)
         self.worker_threads_spin = QSpinBox()
-        self.worker_threads_spin.setRange(1, 16)
-        self.worker_threads_spin.setValue(4)
+        self.worker_threads_spin.setRange(0, 16)
+        self.worker_threads_spin.setSpecialValueText("Auto")  # one per CPU
+        self.worker_threads_spin.setValue(0)
         performance_layout.addWidget(self.worker_threads_spin, 0, 1)
         
         performance_layout.addWidget(QLabel("Memory Limit:"), 1, 0)
@@ -374,6 +375,7 @@ class SettingsTab(QWidget):
         self.png_compression_slider.setValue(settings.conversion.png_compression)
         self.max_size_spin.setValue(settings.conversion.max_image_size)
         self.maintain_aspect_check.setChecked(settings.conversion.maintain_aspect_ratio)
+        self.worker_threads_spin.setValue(settings.conversion.max_workers)
         
         # Set default format
         format_index = self.default_format_combo.findText(settings.conversion.default_output_format)
@@ -429,6 +431,8 @@ class SettingsTab(QWidget):
     def _apply_settings(self):
         """Apply current settings"""
         try:
+            previous = self.config.settings
+            
             # Update configuration
             self.config.update_settings(**{
                 'conversion.jpeg_quality': self.jpeg_quality_slider.value(),
@@ -437,6 +441,7 @@ class SettingsTab(QWidget):
                 'conversion.default_output_format': self.default_format_combo.currentText(),
                 'conversion.max_image_size': self.max_size_spin.value(),
                 'conversion.maintain_aspect_ratio': self.maintain_aspect_check.isChecked(),
+                'conversion.max_workers': self.worker_threads_spin.value(),
                 'ui.window_width': self.window_width_spin.value(),
                 'ui.window_height': self.window_height_spin.value(),
                 'ui.show_preview': self.show_preview_check.isChecked(),
@@ -463,7 +468,7 @@ class SettingsTab(QWidget):
                     if not success:
                         logger.warning(f"Failed to apply language: {language_code}")
             
-            self.settings_changed.emit()
+            self.settings_changed.emit(changed_setting_keys(previous, self.config.settings))
             
             QMessageBox.information(self, "Settings", "Settings applied successfully!")
             logger.info("Settings applied by user")
@@ -492,6 +497,7 @@ class SettingsTab(QWidget):
             from ..core.config import AppSettings
             default_settings = AppSettings()
             
+            previous = self.config.settings
             self.config._settings = default_settings
             self.config.save()
             
@@ -501,7 +507,7 @@ class SettingsTab(QWidget):
                 self.appearance_manager.set_language('en')
             
             self._load_settings()
-            self.settings_changed.emit()
+            self.settings_changed.emit(changed_setting_keys(previous, self.config.settings))
             
             QMessageBox.information(self, "Settings", "Settings reset to defaults!")
             logger.info("Settings reset to defaults")
@@ -553,7 +559,8 @@ class SettingsTab(QWidget):
                 'conversion.png_compression': 6,
                 'conversion.default_output_format': 'png',
                 'conversion.max_image_size': 4096,
-                'conversion.maintain_aspect_ratio': True
+                'conversion.maintain_aspect_ratio': True,
+                'conversion.max_workers': 0
             })
             
             self._load_settings()
@@ -570,7 +577,6 @@ class SettingsTab(QWidget):
             if parent_window and hasattr(parent_window, 'db_manager'):
                 with parent_window.db_manager.get_connection() as conn:
                     conn.execute("VACUUM")
-                    conn.commit()
                 
                 QMessageBox.information(self, "Database", "Database optimized successfully!")
                 logger.info("Database optimized")
@@ -630,9 +636,8 @@ class SettingsTab(QWidget):
                     parent_window = parent_window.parent()
                 
                 if parent_window and hasattr(parent_window, 'db_manager'):
-                    with parent_window.db_manager.get_connection() as conn:
+                    with parent_window.db_manager.transaction() as conn:
                         conn.execute("DELETE FROM conversion_history")
-                        conn.commit()
                     
                     QMessageBox.information(self, "Clear History", "Conversion history cleared successfully!")
                     logger.info("Conversion history cleared by user")
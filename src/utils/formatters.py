@@ -1,6 +1,9 @@
 """Utility formatters for display"""
 
+from functools import lru_cache
 
+
+@lru_cache(maxsize=1024)
 def format_file_size(size_bytes: int) -> str:
     """Format file size in human readable format"""
     if size_bytes == 0:
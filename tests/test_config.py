@@ -1,7 +1,7 @@
 """Test configuration management"""
 
 import pytest
-from src.core.config import AppConfig, AppSettings, ConversionSettings
+from src.core.config import AppConfig, AppSettings, ConversionSettings, changed_setting_keys
 
 
 def test_default_config(test_config):
@@ -32,3 +32,44 @@ def test_invalid_settings():
 
     with pytest.raises(ValueError):
         ConversionSettings(default_output_format="invalid")  # Invalid format
+
+
+def test_update_settings_validates_section(test_config):
+    """Test invalid section updates are rejected and leave settings untouched"""
+    test_config.update_settings(**{"conversion.jpeg_quality": 150})
+    assert test_config.settings.conversion.jpeg_quality == 85
+
+    test_config.update_settings(**{"ui.theme": "dark", "logging_level": "debug"})
+    assert test_config.settings.ui.theme == "dark"
+    assert test_config.settings.logging_level == "DEBUG"
+    assert test_config.settings.conversion.jpeg_quality == 85
+
+
+def test_debounced_save(qapp, test_config):
+    """Test saves are deferred on the GUI thread until flushed"""
+    test_config.update_settings(**{"ui.window_width": 1200})
+    assert AppConfig(test_config.app_data_dir).settings.ui.window_width == 800
+
+    test_config.flush()
+    assert AppConfig(test_config.app_data_dir).settings.ui.window_width == 1200
+
+
+def test_load_is_cached_by_mtime(test_config):
+    """Test unchanged config files are not re-parsed"""
+    first = AppConfig(test_config.app_data_dir)
+    second = AppConfig(test_config.app_data_dir)
+    assert first.settings is second.settings
+
+    first.update_settings(**{"conversion.webp_quality": 70})
+    first.flush()
+    assert AppConfig(test_config.app_data_dir).settings.conversion.webp_quality == 70
+
+
+def test_changed_setting_keys(test_config):
+    """Test only the keys whose values differ are reported"""
+    before = test_config.settings
+    test_config.update_settings(
+        **{"ui.theme": "dark", "ui.window_width": 800, "logging_level": "DEBUG"}
+    )
+    assert changed_setting_keys(before, test_config.settings) == {"ui.theme", "logging_level"}
+    assert changed_setting_keys(before, before) == set()
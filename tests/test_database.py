@@ -0,0 +1,130 @@
+"""Test database management"""
+
+from datetime import datetime
+
+from src.core.database import ConversionRecord
+
+
+def _make_record(index: int, status: str = "completed") -> ConversionRecord:
+    return ConversionRecord(
+        source_path=f"/tmp/source_{index}.png",
+        target_path=f"/tmp/target_{index}.webp",
+        source_format="png",
+        target_format="webp",
+        source_size=2000,
+        target_size=500,
+        width=100,
+        height=100,
+        created_at=datetime.now(),
+        duration_ms=10,
+        status=status,
+    )
+
+
+def test_add_conversion_record(test_db):
+    """Test single record insert and retrieval"""
+    record_id = test_db.add_conversion_record(_make_record(1))
+    assert record_id > 0
+
+    history = test_db.get_conversion_history()
+    assert len(history) == 1
+    assert history[0].source_path == "/tmp/source_1.png"
+
+
+def test_add_conversion_records_batch(test_db):
+    """Test batch insert in a single transaction"""
+    records = [_make_record(i) for i in range(10)] + [_make_record(10, status="failed")]
+    assert test_db.add_conversion_records(records) == 11
+    assert test_db.add_conversion_records([]) == 0
+
+    stats = test_db.get_statistics()
+    assert stats["total_conversions"] == 10
+    assert stats["by_format"] == {"webp": 10}
+    assert stats["size_saved_bytes"] == 10 * 1500
+
+
+def test_connection_reused(test_db):
+    """Test the same thread gets the same cached connection"""
+    with test_db.get_connection() as first, test_db.get_connection() as second:
+        assert first is second
+
+    test_db.close()
+    with test_db.get_connection() as reopened:
+        assert reopened is not first
+
+
+def test_transaction_rollback(test_db):
+    """Test failed writes inside a transaction are rolled back"""
+    try:
+        with test_db.transaction() as conn:
+            conn.execute(
+                "INSERT INTO app_settings (key, value) VALUES (?, ?)", ("theme", "dark")
+            )
+            raise RuntimeError("abort")
+    except RuntimeError:
+        pass
+
+    with test_db.get_connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM app_settings").fetchone()[0] == 0
+
+
+def test_statistics_cache_invalidated(test_db):
+    """Test cached statistics refresh after inserts and deletes"""
+    assert test_db.get_statistics()["total_conversions"] == 0
+
+    test_db.add_conversion_record(_make_record(1))
+    assert test_db.get_statistics()["total_conversions"] == 1
+
+    with test_db.transaction() as conn:
+        conn.execute("DELETE FROM conversion_history")
+    assert test_db.get_statistics()["total_conversions"] == 0
+
+
+def test_statistics_updated_incrementally_on_insert(test_db):
+    """Test inserts are added to cached statistics instead of re-querying"""
+    test_db.add_conversion_record(_make_record(1))
+    test_db.get_statistics()  # cache the aggregate
+
+    with test_db.get_connection() as conn:
+        # Rows written behind the manager's back are not seen while the cache holds
+        conn.execute("DELETE FROM conversion_history")
+
+    test_db.add_conversion_records([_make_record(2), _make_record(3, status="failed")])
+    stats = test_db.get_statistics()
+    assert stats["total_conversions"] == 2
+    assert stats["by_format"] == {"webp": 2}
+    assert stats["size_saved_bytes"] == 2 * 1500
+
+
+def test_history_parses_timestamps(test_db):
+    """Test history rows are validated into records with parsed timestamps"""
+    test_db.add_conversion_records([_make_record(i) for i in range(3)])
+
+    history = test_db.get_conversion_history(limit=2)
+    assert len(history) == 2
+    assert all(isinstance(record.created_at, datetime) for record in history)
+    assert all(record.id is not None for record in history)
+
+
+def test_queued_records_written_in_background(test_db):
+    """Test queued records are committed by the writer thread"""
+    for i in range(5):
+        test_db.queue_conversion_record(_make_record(i))
+
+    test_db.flush()
+
+    assert len(test_db.get_conversion_history()) == 5
+    assert test_db.get_statistics()["total_conversions"] == 5
+
+
+def test_history_since_and_change_signal(test_db):
+    """Test inserts emit history_changed and can be fetched incrementally"""
+    changes = []
+    test_db.history_changed.connect(lambda: changes.append(True))
+
+    first_id = test_db.add_conversion_record(_make_record(1))
+    test_db.add_conversion_records([_make_record(2), _make_record(3)])
+
+    assert len(changes) == 2
+    newer = test_db.get_conversion_history_since(first_id)
+    assert [record.source_path for record in newer] == ["/tmp/source_3.png", "/tmp/source_2.png"]
@@ -0,0 +1,450 @@
+"""Test GIF processing extension"""
+
+import pytest
+from PIL import Image, ImageChops, ImageFilter, ImageStat
+
+from src.extensions.gif_processor import GifCreationParams, GifOptimizationParams, GifProcessor
+
+
+def _make_frames(temp_dir, count: int):
+    colors = ["red", "green", "blue", "yellow", "purple", "orange"]
+    paths = []
+    for i in range(count):
+        path = temp_dir / f"frame_{i}.png"
+        Image.new("RGB", (64, 48), color=colors[i % len(colors)]).save(path)
+        paths.append(path)
+    return paths
+
+
+def test_create_gif_from_images(temp_dir):
+    """Test animated GIF creation keeps every frame"""
+    paths = _make_frames(temp_dir, 5)
+    output = temp_dir / "out.gif"
+
+    record = GifProcessor().create_gif_from_images(
+        paths, output, GifCreationParams(frame_duration=200, max_workers=2)
+    )
+
+    assert record.status == "completed"
+    assert (record.width, record.height) == (64, 48)
+    with Image.open(output) as gif:
+        assert gif.n_frames == 5
+
+
+def test_shared_palette_keeps_every_frame_color(temp_dir):
+    """Test the shared palette covers colors from all frames, not just the first"""
+    paths = _make_frames(temp_dir, 4)
+    output = temp_dir / "shared.gif"
+
+    GifProcessor().create_gif_from_images(paths, output, GifCreationParams())
+
+    with Image.open(output) as gif:
+        for i, path in enumerate(paths):
+            gif.seek(i)
+            with Image.open(path) as source:
+                assert gif.convert("RGB").getpixel((10, 10)) == source.getpixel((10, 10))
+
+
+def test_palette_reused_for_unchanged_sources(temp_dir):
+    """Test re-encoding the same sources skips palette training"""
+    paths = _make_frames(temp_dir, 3)
+    processor = GifProcessor()
+
+    processor.create_gif_from_images(paths, temp_dir / "a.gif", GifCreationParams())
+    palette = processor._palette_cache[1]
+    processor.create_gif_from_images(
+        paths, temp_dir / "b.gif", GifCreationParams(frame_duration=300)
+    )
+    assert processor._palette_cache[1] is palette
+
+    processor.create_gif_from_images(paths, temp_dir / "c.gif", GifCreationParams(max_colors=16))
+    assert processor._palette_cache[1] is not palette
+    assert len(processor._palette_cache[1].getpalette()) <= 16 * 3
+
+
+def test_optimize_gif_keeps_frames(temp_dir):
+    """Test optimization keeps every distinct frame"""
+    paths = _make_frames(temp_dir, 3)
+    source = temp_dir / "source.gif"
+    GifProcessor().create_gif_from_images(paths, source, GifCreationParams())
+
+    target = temp_dir / "optimized.gif"
+    record = GifProcessor().optimize_gif(source, target, GifOptimizationParams(max_colors=64))
+
+    assert record.status == "completed"
+    with Image.open(target) as gif:
+        assert gif.n_frames == 3
+        gif.seek(2)
+        assert gif.info["duration"] == 500
+
+
+def test_extract_gif_frames(temp_dir):
+    """Test frames are extracted in order with progress reaching 100"""
+    paths = _make_frames(temp_dir, 6)
+    source = temp_dir / "source.gif"
+    GifProcessor().create_gif_from_images(paths, source, GifCreationParams())
+
+    progress = []
+    extracted = GifProcessor().extract_gif_frames(
+        source, temp_dir / "frames", "png", progress_callback=progress.append
+    )
+
+    assert [path.name for path in extracted] == [f"frame_{i:04d}.png" for i in range(6)]
+    assert all(path.exists() for path in extracted)
+    assert progress == sorted(progress) and progress[-1] == 100
+    with Image.open(extracted[2]) as frame, Image.open(paths[2]) as original:
+        assert frame.convert("RGB").getpixel((5, 5)) == original.getpixel((5, 5))
+
+
+def test_palette_method_follows_optimize():
+    """Test palette training defaults to fast octree only when optimizing"""
+    assert GifCreationParams().palette_method() == Image.Quantize.FASTOCTREE
+    assert GifCreationParams(optimize=False).palette_method() == Image.Quantize.MEDIANCUT
+    assert (
+        GifCreationParams(quantize_method=Image.Quantize.MAXCOVERAGE).palette_method()
+        == Image.Quantize.MAXCOVERAGE
+    )
+
+
+def test_create_gif_resizes_large_jpeg_sources(temp_dir):
+    """Test JPEG sources are resized to the requested frame size"""
+    paths = []
+    for i, color in enumerate(["red", "blue", "green"]):
+        path = temp_dir / f"large_{i}.jpg"
+        Image.new("RGB", (2000, 1500), color=color).save(path, "JPEG")
+        paths.append(path)
+    output = temp_dir / "resized.gif"
+
+    record = GifProcessor().create_gif_from_images(
+        paths, output, GifCreationParams(resize_width=200, resize_height=150, maintain_aspect=False)
+    )
+
+    assert (record.width, record.height) == (200, 150)
+    with Image.open(output) as gif:
+        assert gif.size == (200, 150)
+        assert gif.n_frames == 3
+
+
+def test_frame_state_round_trip_keeps_rgba_palette():
+    """Test frames cross the process pool with their palette alpha intact"""
+    from src.extensions.gif_processor import _frame_from_state, _frame_to_state
+
+    image = Image.new("RGBA", (4, 4), (255, 0, 0, 0))
+    image.putpixel((0, 0), (0, 255, 0, 255))
+    frame = image.quantize()
+
+    restored = _frame_from_state(_frame_to_state(frame))
+
+    assert restored.convert("RGBA").getpixel((1, 1)) == (255, 0, 0, 0)
+    assert restored.convert("RGBA").getpixel((0, 0)) == (0, 255, 0, 255)
+
+
+def test_normalize_for_gif_modes():
+    """Test source modes are routed to P or RGB with alpha flattened onto white"""
+    from src.extensions.gif_processor import _normalize_for_gif
+
+    rgb = Image.new("RGB", (2, 2))
+    assert _normalize_for_gif(rgb) is rgb
+    assert _normalize_for_gif(Image.new("L", (2, 2), 128)).mode == "P"
+    assert _normalize_for_gif(Image.new("CMYK", (2, 2))).mode == "RGB"
+
+    flattened = _normalize_for_gif(Image.new("RGBA", (2, 2), (0, 0, 0, 0)))
+    assert flattened.mode == "RGB"
+    assert flattened.getpixel((0, 0)) == (255, 255, 255)
+
+
+def test_progress_reported_once_per_percent(temp_dir):
+    """Test GIF creation never repeats a progress value"""
+    paths = _make_frames(temp_dir, 150)
+    progress = []
+    frames = []
+
+    GifProcessor().create_gif_from_images(
+        paths,
+        temp_dir / "many.gif",
+        GifCreationParams(),
+        progress_callback=progress.append,
+        frame_callback=lambda done, total: frames.append(done),
+    )
+
+    assert len(progress) == len(set(progress))
+    assert progress[-1] == 100
+    # One frame report per percent step between the start (5) and finish (100)
+    assert len(frames) == len(progress) - 2
+    assert frames == sorted(set(frames)) and frames[-1] == 150
+
+
+def test_optimize_gif_without_reduction_skips_reencode(temp_dir, monkeypatch):
+    """Test nothing is re-encoded when neither colors nor transparency are processed"""
+    monkeypatch.setattr("src.extensions.gif_processor.shutil.which", lambda name: None)
+    paths = _make_frames(temp_dir, 3)
+    source = temp_dir / "source.gif"
+    GifProcessor().create_gif_from_images(paths, source, GifCreationParams())
+
+    target = temp_dir / "copy.gif"
+    record = GifProcessor().optimize_gif(
+        source, target, GifOptimizationParams(reduce_colors=False, transparency=False)
+    )
+
+    assert target.read_bytes() == source.read_bytes()
+    assert (record.width, record.height) == (64, 48)
+
+
+def test_save_frame_flattens_alpha_for_jpeg(temp_dir):
+    """Test transparent frames are composited onto white for JPEG output"""
+    from src.extensions.gif_processor import _save_frame
+
+    frame = Image.new("RGBA", (8, 8), (0, 0, 0, 0))
+    frame.putpixel((0, 0), (255, 0, 0, 255))
+    path = temp_dir / "frame.jpg"
+
+    _save_frame(frame, path, "jpg")
+
+    with Image.open(path) as saved:
+        assert saved.mode == "RGB"
+        assert all(channel > 240 for channel in saved.getpixel((7, 7)))
+
+
+def test_create_gif_missing_source_fails(temp_dir):
+    """Test an unreadable source surfaces from the palette pass"""
+    paths = _make_frames(temp_dir, 2) + [temp_dir / "broken.png"]
+    paths[-1].write_bytes(b"not an image")
+
+    with pytest.raises(Exception):
+        GifProcessor().create_gif_from_images(paths, temp_dir / "fail.gif", GifCreationParams())
+
+
+def test_extract_gif_frames_as_bmp(temp_dir):
+    """Test frames can be extracted as uncompressed BMP"""
+    paths = _make_frames(temp_dir, 3)
+    source = temp_dir / "source.gif"
+    GifProcessor().create_gif_from_images(paths, source, GifCreationParams())
+
+    extracted = GifProcessor().extract_gif_frames(source, temp_dir / "bmp", "bmp")
+
+    with Image.open(extracted[1]) as frame, Image.open(paths[1]) as original:
+        assert frame.format == "BMP"
+        assert frame.convert("RGB").getpixel((5, 5)) == original.getpixel((5, 5))
+
+
+def test_fast_animations_remap_without_dither():
+    """Test frames shorter than FAST_ANIMATION_MS skip dithering"""
+    assert GifCreationParams(frame_duration=100).remap_dither() == Image.Dither.NONE
+    assert GifCreationParams(frame_duration=500).remap_dither() == Image.Dither.FLOYDSTEINBERG
+
+
+def test_extract_gif_frames_precounted_progress(temp_dir):
+    """Test opt-in frame precount reports progress per frame"""
+    paths = _make_frames(temp_dir, 4)
+    source = temp_dir / "source.gif"
+    GifProcessor().create_gif_from_images(paths, source, GifCreationParams())
+
+    progress = []
+    GifProcessor().extract_gif_frames(
+        source, temp_dir / "frames", progress_callback=progress.append, precount_frames=True
+    )
+
+    assert progress == [25, 50, 75, 100]
+
+
+def _transparency_indices(data: bytes):
+    """Global color table size and the transparent indices of a GIF's control blocks"""
+    table_size = 2 << (data[10] & 7)
+    indices = {
+        data[i + 6]
+        for i in range(len(data) - 6)
+        if data[i:i + 3] == b"!\xf9\x04" and data[i + 3] & 1
+    }
+    return table_size, indices
+
+
+@pytest.mark.parametrize("max_colors", [256, 128])
+def test_optimize_leaves_transparent_index_for_deltas(temp_dir, max_colors):
+    """Test optimized GIFs keep a spare palette entry and still decode every frame"""
+    base = Image.effect_noise((64, 48), 90).convert("RGB")
+    paths = []
+    for i in range(3):
+        frame = base.copy()
+        frame.paste((255, 0, 0), (i * 10, 0, i * 10 + 10, 10))
+        path = temp_dir / f"delta_{i}.png"
+        frame.save(path)
+        paths.append(path)
+
+    assert GifCreationParams().palette_colors() == 255
+    assert GifCreationParams(optimize=False).palette_colors() == 256
+
+    output = temp_dir / "delta.gif"
+    GifProcessor().create_gif_from_images(paths, output, GifCreationParams(max_colors=max_colors))
+
+    # The transparent index must be an entry of the global color table
+    table_size, indices = _transparency_indices(output.read_bytes())
+    assert indices
+    assert all(index < table_size for index in indices)
+
+    with Image.open(output) as gif:
+        assert gif.n_frames == 3
+        gif.seek(2)
+        assert gif.convert("RGB").getpixel((25, 5)) == (255, 0, 0)
+
+
+def test_parallel_encode_matches_pillow_writer(temp_dir):
+    """Test stitched frames decode like Pillow's own GIF writer and merge repeats"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from src.extensions.gif_processor import _frame_to_state
+
+    base = Image.effect_noise((64, 48), 90).convert("RGB")
+    sources = []
+    for i in range(4):
+        frame = base.copy()
+        frame.paste((255, 0, 0), (i * 10, 0, i * 10 + 10, 10))
+        sources.append(frame)
+    sources.insert(2, sources[1])  # repeated frame
+
+    palette = base.quantize(colors=255)
+    frames = [frame.quantize(palette=palette) for frame in sources]
+    output = temp_dir / "stitched.gif"
+    expected = temp_dir / "pillow.gif"
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        GifProcessor()._write_gif(
+            executor,
+            (_frame_to_state(frame) for frame in frames),
+            output,
+            GifCreationParams(frame_duration=100, max_workers=2),
+            2 * len(frames),
+        )
+    frames[0].save(
+        expected, save_all=True, append_images=frames[1:], duration=100, loop=0, optimize=True
+    )
+
+    with Image.open(output) as gif, Image.open(expected) as reference:
+        assert gif.n_frames == reference.n_frames == 4
+        for i in range(gif.n_frames):
+            gif.seek(i)
+            reference.seek(i)
+            assert gif.info["duration"] == reference.info["duration"]
+            assert gif.convert("RGB").tobytes() == reference.convert("RGB").tobytes()
+
+
+def test_few_color_sources_keep_exact_colors(temp_dir):
+    """Test screenshot-style sources skip palette training and keep exact colors"""
+    paths = []
+    for i in range(3):
+        frame = Image.new("RGB", (60, 10))
+        # Neighboring shades the reduced-precision remap would merge
+        for x in range(60):
+            frame.paste((100 + x, 100 + i, 100), (x, 0, x + 1, 10))
+        path = temp_dir / f"shades_{i}.png"
+        frame.save(path)
+        paths.append(path)
+
+    output = temp_dir / "shades.gif"
+    GifProcessor().create_gif_from_images(paths, output, GifCreationParams())
+
+    with Image.open(output) as gif:
+        for i, path in enumerate(paths):
+            gif.seek(i)
+            with Image.open(path) as source:
+                assert gif.convert("RGB").tobytes() == source.tobytes()
+
+
+def test_optimize_uses_gifsicle_when_installed(temp_dir, monkeypatch):
+    """Test optimization options are passed to gifsicle instead of re-encoding"""
+    import shutil
+    import subprocess
+
+    calls = []
+
+    def fake_run(args, **kwargs):
+        calls.append(args)
+        shutil.copy2(args[-1], args[args.index("-o") + 1])
+        return subprocess.CompletedProcess(args, 0, b"", b"")
+
+    monkeypatch.setattr("src.extensions.gif_processor.shutil.which", lambda name: "gifsicle")
+    monkeypatch.setattr("src.extensions.gif_processor.subprocess.run", fake_run)
+    paths = _make_frames(temp_dir, 2)
+    source = temp_dir / "source.gif"
+    GifProcessor().create_gif_from_images(paths, source, GifCreationParams())
+
+    target = temp_dir / "lossy.gif"
+    record = GifProcessor().optimize_gif(
+        source, target, GifOptimizationParams(max_colors=64, lossy=80)
+    )
+
+    assert calls == [
+        ["gifsicle", "-O3", "--colors", "64", "--dither", "--lossy=80"]
+        + ["-o", str(target), str(source)]
+    ]
+    assert record.status == "completed"
+    assert (record.width, record.height) == (64, 48)
+
+
+def test_mixed_palette_sources_use_local_color_tables(temp_dir):
+    """Test frames keeping their own palette decode correctly next to remapped ones"""
+    paths = _make_frames(temp_dir, 2)
+    gray = temp_dir / "gray.png"
+    Image.new("L", (64, 48), 77).save(gray)
+    indexed = temp_dir / "indexed.png"
+    Image.new("RGB", (64, 48), (10, 200, 30)).quantize(colors=4).save(indexed)
+    sources = [paths[0], gray, indexed, paths[1]]
+
+    output = temp_dir / "mixed.gif"
+    GifProcessor().create_gif_from_images(iter(sources), output, GifCreationParams(max_workers=2))
+
+    with Image.open(output) as gif:
+        assert gif.n_frames == 4
+        for i, path in enumerate(sources):
+            gif.seek(i)
+            with Image.open(path) as source:
+                expected = source.convert("RGB").getpixel((5, 5))
+            assert gif.convert("RGB").getpixel((5, 5)) == expected
+
+
+def _mean_squared_error(first: Image.Image, second: Image.Image) -> float:
+    diff = ImageChops.difference(first.convert("RGB"), second.convert("RGB"))
+    return sum(rms * rms for rms in ImageStat.Stat(diff).rms) / 3
+
+
+def test_diverse_frames_no_worse_than_per_frame_palettes(temp_dir):
+    """Test frames the shared palette does not fit get their own palette"""
+    size = (160, 120)
+    tints = [
+        (255, 80, 0), (0, 120, 255), (60, 255, 60), (255, 0, 180), (255, 255, 0), (120, 0, 255)
+    ]
+    sources = []
+    for i, tint in enumerate(tints):
+        # Photo-like frames with little content in common
+        bands = [
+            Image.linear_gradient("L").rotate(90 * (i % 4)).resize(size),
+            Image.radial_gradient("L").resize(size),
+            Image.effect_noise(size, 60).filter(ImageFilter.GaussianBlur(1.5)),
+            Image.effect_mandelbrot(size, (-2 + 0.3 * i, -1.2 + 0.1 * i, 1, 1.2), 30 + 15 * i),
+        ]
+        frame = Image.merge("RGB", [bands[(i + band) % 4] for band in range(3)])
+        sources.append(Image.blend(frame, Image.new("RGB", size, tint), 0.35))
+
+    paths = []
+    for i, source in enumerate(sources):
+        path = temp_dir / f"diverse_{i}.png"
+        source.save(path)
+        paths.append(path)
+
+    output = temp_dir / "diverse.gif"
+    GifProcessor().create_gif_from_images(paths, output, GifCreationParams(max_workers=2))
+
+    # Per-frame quantization, written by Pillow's own encoder
+    expected = temp_dir / "per_frame.gif"
+    frames = [source.quantize(colors=256, dither=Image.Dither.FLOYDSTEINBERG) for source in sources]
+    frames[0].save(
+        expected, save_all=True, append_images=frames[1:], duration=500, loop=0, optimize=True
+    )
+
+    # Small margins for header bytes and the palette entry reserved for transparency
+    assert output.stat().st_size <= expected.stat().st_size * 1.02
+    with Image.open(output) as gif, Image.open(expected) as reference:
+        for i, source in enumerate(sources):
+            gif.seek(i)
+            reference.seek(i)
+            error = _mean_squared_error(source, gif)
+            assert error <= _mean_squared_error(source, reference) * 1.1 + 1
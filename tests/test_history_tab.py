@@ -0,0 +1,52 @@
+"""Test history tab behaviour"""
+
+from datetime import datetime
+
+import pytest
+
+from src.core.database import ConversionRecord
+from src.ui.history_tab import HistoryTab
+
+
+def _make_record(index: int) -> ConversionRecord:
+    return ConversionRecord(
+        source_path=f"/tmp/source_{index}.png",
+        target_path=f"/tmp/target_{index}.webp",
+        source_format="png",
+        target_format="webp",
+        source_size=2000,
+        target_size=500,
+        width=100,
+        height=100,
+        created_at=datetime.now(),
+        duration_ms=10,
+        status="completed",
+    )
+
+
+@pytest.fixture
+def history_tab(qapp, test_db):
+    """Create a history tab (not shown)"""
+    tab = HistoryTab(test_db)
+    yield tab
+    tab.deleteLater()
+
+
+def test_clearing_history_empties_the_table(history_tab, test_db):
+    """Test a delete through the database reloads the table instead of keeping stale rows"""
+    test_db.add_conversion_records([_make_record(i) for i in range(3)])
+    assert history_tab.history_model.rowCount() == 3
+
+    # As the Settings tab clears history: no reference to the history tab
+    with test_db.transaction() as conn:
+        conn.execute("DELETE FROM conversion_history")
+
+    assert history_tab.history_model.rowCount() == 0
+    assert history_tab.total_label.text() == "Total: 0"
+
+    # Later inserts are appended to the empty table, not on top of deleted rows
+    test_db.add_conversion_record(_make_record(3))
+    assert [record.source_path for record in history_tab.history_model.records] == [
+        "/tmp/source_3.png"
+    ]
+    assert history_tab.total_label.text() == "Total: 1"
@@ -0,0 +1,55 @@
+"""Test image processing engine"""
+
+from PIL import Image
+
+from src.core.image_processor import ConversionParams, ImageProcessor
+
+
+def test_resize_large_jpeg(temp_dir):
+    """Test JPEG sources are downscaled to the requested box"""
+    source = temp_dir / "large.jpg"
+    Image.new("RGB", (4000, 3000), color="green").save(source)
+
+    processor = ImageProcessor()
+    params = ConversionParams(target_format="png", resize_width=400, resize_height=400)
+    record = processor.convert_image(source, temp_dir / "small.png", params)
+
+    assert (record.width, record.height) == (400, 300)
+    with Image.open(temp_dir / "small.png") as img:
+        assert img.size == (400, 300)
+
+
+def test_resize_noop_keeps_image(sample_image):
+    """Test resizing to the current size returns the image untouched"""
+    processor = ImageProcessor()
+    params = ConversionParams(target_format="png", resize_width=100, resize_height=100)
+
+    with Image.open(sample_image) as img:
+        assert processor._resize_image(img, params) is img
+
+
+def test_ico_contains_all_sizes(temp_dir):
+    """Test ICO output keeps every size that fits the source"""
+    source = temp_dir / "square.png"
+    Image.new("RGBA", (300, 300), color=(255, 0, 0, 128)).save(source)
+
+    processor = ImageProcessor()
+    processor.convert_image(source, temp_dir / "icon.ico", ConversionParams(target_format="ico"))
+
+    with Image.open(temp_dir / "icon.ico") as ico:
+        assert ico.info["sizes"] == {
+            (16, 16), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)
+        }
+
+
+def test_jpeg_flattens_alpha_on_white():
+    """Test transparent pixels become white when targeting JPEG"""
+    processor = ImageProcessor()
+    img = Image.new("RGBA", (10, 10), color=(0, 0, 0, 0))
+    img.putpixel((0, 0), (255, 0, 0, 255))
+
+    flattened = processor._convert_color_mode(img, "jpg")
+    assert flattened.mode == "RGB"
+    assert flattened.getpixel((0, 0)) == (255, 0, 0)
+    assert flattened.getpixel((5, 5)) == (255, 255, 255)
+    assert processor._convert_color_mode(img, "png") is img
@@ -0,0 +1,33 @@
+"""Test main window behaviour"""
+
+import pytest
+from PyQt6.QtCore import Qt
+
+from src.ui import main_window
+from src.ui.main_window import CLOCK_INTERVAL_MS, MainWindow
+
+
+@pytest.fixture
+def window(qapp, test_config, test_db):
+    """Create a main window (not shown)"""
+    win = MainWindow(test_config, test_db)
+    yield win
+    win.clock_timer.stop()
+    win.deleteLater()
+
+
+@pytest.mark.parametrize(
+    "seconds_into_minute, expected_ms",
+    [(0.0, CLOCK_INTERVAL_MS), (30.25, 29_750), (59.6, 400), (59.999, 1)],
+)
+def test_clock_rearms_for_next_minute(window, monkeypatch, seconds_into_minute, expected_ms):
+    """Test the clock re-arms for the next minute boundary, even just before it"""
+    minute = 1_700_000_040  # a whole minute (multiple of 60 s)
+    monkeypatch.setattr(main_window.time, "time", lambda: minute + seconds_into_minute)
+
+    window._update_clock()
+
+    assert window.clock_timer.isActive()
+    assert window.clock_timer.isSingleShot()
+    assert window.clock_timer.timerType() == Qt.TimerType.PreciseTimer
+    assert window.clock_timer.interval() == expected_ms
@@ -0,0 +1,27 @@
+"""Test background conversion worker"""
+
+from src.core.image_processor import ConversionParams
+from src.core.worker import ConversionWorker
+
+
+def test_batch_conversion(temp_dir, sample_image, test_db):
+    """Test parallel batch conversion records every file"""
+    from PIL import Image
+
+    files = [sample_image]
+    for i in range(3):
+        path = temp_dir / f"extra_{i}.png"
+        Image.new("RGB", (50, 50), color="blue").save(path)
+        files.append(path)
+    files.append(temp_dir / "missing.png")
+
+    failed = []
+    worker = ConversionWorker(
+        files, temp_dir / "out", ConversionParams(target_format="webp"), test_db, max_workers=2
+    )
+    worker.file_failed.connect(lambda path, error: failed.append(path))
+    worker.run()
+
+    assert failed == [str(temp_dir / "missing.png")]
+    assert len(test_db.get_conversion_history()) == 4
+    assert (temp_dir / "out" / "extra_0.webp").exists()